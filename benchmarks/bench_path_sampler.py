@@ -0,0 +1,76 @@
+"""比较 point_from_proportion 与 path_sampler 的单次查询耗时
+
+用法: python benchmarks/bench_path_sampler.py [--queries 2000]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from manim import *
+import numpy as np
+from src.path_sampler import path_sampler
+
+
+def get_paths():
+    """测试用路径：sinx.py 中的圆，以及 circl.py 中的抛物线"""
+    circle = Circle(radius=1).move_to(np.array([-4, 0, 0]))
+    axes = Axes(x_range=[-3, 3, 1], y_range=[-1, 9, 1])
+    graph = axes.plot(lambda x: x**2, color=RED)
+    return {'circle': circle, 'graph': graph}
+
+
+def bench_path(path, queries):
+    proportions = np.random.default_rng(0).random(queries)
+
+    def baseline():
+        for t in proportions:
+            path.point_from_proportion(t)
+
+    sampler_holder = {}
+
+    def build():
+        sampler_holder['sampler'] = path_sampler(path)
+
+    build_time = timeit.timeit(build, number=1)
+    sampler = sampler_holder['sampler']
+
+    def sampled():
+        for t in proportions:
+            sampler.point_at(t)
+
+    def vectorized():
+        sampler.points_at(proportions)
+
+    expected = np.array([path.point_from_proportion(t) for t in proportions])
+    max_error = np.abs(sampler.points_at(proportions) - expected).max()
+
+    return {
+        'point_from_proportion': timeit.timeit(baseline, number=1) / queries,
+        'sampler.point_at': timeit.timeit(sampled, number=1) / queries,
+        'sampler.points_at': timeit.timeit(vectorized, number=1) / queries,
+        'build': build_time,
+        'max_error': max_error,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--queries', type=int, default=2000)
+    args = parser.parse_args()
+
+    for name, path in get_paths().items():
+        result = bench_path(path, args.queries)
+        speedup = result['point_from_proportion'] / result['sampler.point_at']
+        print(f"{name}:")
+        for key in ('point_from_proportion', 'sampler.point_at', 'sampler.points_at'):
+            print(f"  {key:<22} {result[key] * 1e6:10.2f} us/query")
+        print(f"  {'build':<22} {result['build'] * 1e3:10.2f} ms")
+        print(f"  {'speedup':<22} {speedup:10.1f}x")
+        print(f"  {'max error':<22} {result['max_error']:10.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+"""渲染仓库中所有场景并记录耗时和内存
+
+每个场景在单独的子进程中渲染（峰值 RSS 只能按进程统计），
+结果写入 JSON 文件，可以和保存的基准结果比较，超过阈值时返回非零退出码。
+
+用法:
+    python benchmarks/bench_scenes.py --output bench.json
+    python benchmarks/bench_scenes.py --output bench.json --baseline baseline.json --threshold 1.2
+    python benchmarks/bench_scenes.py --scenes sinx:SineCurveUnitCircle --qualities low
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# 不导入 manim：主进程只调度，manim 只在每个场景的子进程中导入
+from src.render_options import QUALITIES
+
+SCENES = [
+    'vector1:BasicVectors',
+    'vector2:BasicVectors',
+    'vectorclass:FlexibleVectorDiagram',
+    'vectorclass:CustomVectorDiagram1',
+    'vectorclass:CustomVectorDiagram2',
+    'sinx:SineCurveUnitCircle',
+    'moving1:TestMovingPoint',
+    'moving2:MovingOnLine',
+    'moving2:MovingOnCurve',
+    'moving3:MultiplePoints',
+    'vector11:vecetor_example',
+    'circl:AnimatedGraph',
+    'vector_field:VectorFieldExample',
+]
+
+# 默认测量的画质
+DEFAULT_QUALITIES = ['low', 'high']
+
+# 与基准比较的指标（越小越好）
+COMPARED_METRICS = ['wall_time', 'time_per_frame', 'peak_rss', 'tracemalloc_peak']
+
+
+def run_one(scene_id, quality, trace_memory):
+    """子进程：渲染一个场景并返回测量结果"""
+    import resource
+    import tracemalloc
+
+    from src.scene_runner import render_scene
+
+    module_name, scene_name = scene_id.split(':')
+    media_dir = tempfile.mkdtemp(prefix='bench_media_')
+    overrides = {
+        'quality': QUALITIES[quality],
+        'media_dir': media_dir,
+        'disable_caching': True,
+        'progress_bar': 'none',
+        'verbosity': 'WARNING',
+        'preview': False,
+    }
+
+    try:
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        scene = render_scene(module_name, scene_name, overrides)
+        wall_time = time.perf_counter() - start
+        tracemalloc_peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        shutil.rmtree(media_dir, ignore_errors=True)
+
+    frames = round(scene.renderer.time * scene.renderer.camera.frame_rate)
+    # Linux 上 ru_maxrss 的单位是 KB，macOS 上是字节
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if platform.system() != 'Darwin':
+        peak_rss *= 1024
+
+    return {
+        'wall_time': wall_time,
+        'frames': frames,
+        'time_per_frame': wall_time / frames if frames else None,
+        'peak_rss': peak_rss,
+        'tracemalloc_peak': tracemalloc_peak,
+    }
+
+
+def run_in_subprocess(scene_id, quality, trace_memory):
+    command = [sys.executable, os.path.abspath(__file__), '--run-one', scene_id,
+               '--qualities', quality]
+    if trace_memory:
+        command.append('--trace-memory')
+    process = subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True)
+    if process.returncode != 0:
+        return {'error': process.stderr.strip().splitlines()[-1:] or ['unknown error']}
+    # 只取最后一行 JSON，忽略 manim 可能打印到 stdout 的日志
+    lines = [line for line in process.stdout.splitlines() if line.startswith('{')]
+    return json.loads(lines[-1])
+
+
+def bench(scene_ids, qualities, trace_memory=True):
+    """渲染所有场景，返回 {'scene@quality': 结果}"""
+    results = {}
+    for scene_id in scene_ids:
+        for quality in qualities:
+            key = f'{scene_id}@{quality}'
+            print(f'rendering {key} ...', file=sys.stderr, flush=True)
+            # tracemalloc 会明显拖慢渲染，耗时和内存分两次测量
+            result = run_in_subprocess(scene_id, quality, False)
+            if trace_memory and 'error' not in result:
+                memory = run_in_subprocess(scene_id, quality, True)
+                result['tracemalloc_peak'] = memory.get('tracemalloc_peak')
+            results[key] = result
+    return results
+
+
+def compare(results, baseline, threshold):
+    """返回超过阈值的回归列表 [(key, metric, 基准值, 当前值)]"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base or 'error' in base:
+            continue
+        if 'error' in result:
+            regressions.append((key, 'error', None, result['error']))
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = base.get(metric), result.get(metric)
+            if old and new and new > old * threshold:
+                regressions.append((key, metric, old, new))
+    return regressions
+
+
+def print_table(results):
+    header = f"{'scene':<48} {'wall s':>8} {'frames':>7} {'ms/frame':>9} {'RSS MB':>8} {'heap MB':>8}"
+    print(header)
+    print('-' * len(header))
+    for key, result in results.items():
+        if 'error' in result:
+            print(f'{key:<48} ERROR {result["error"]}')
+            continue
+        per_frame = result['time_per_frame']
+        heap = result.get('tracemalloc_peak')
+        print(
+            f"{key:<48} {result['wall_time']:8.2f} {result['frames']:7d} "
+            f"{per_frame * 1e3 if per_frame else float('nan'):9.2f} "
+            f"{result['peak_rss'] / 2**20:8.1f} "
+            f"{heap / 2**20 if heap else float('nan'):8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every scene in the repository.')
+    parser.add_argument('--scenes', nargs='*', default=SCENES,
+                        help='scenes as module:Scene (default: all)')
+    parser.add_argument('--qualities', nargs='*', default=DEFAULT_QUALITIES,
+                        choices=list(QUALITIES))
+    parser.add_argument('--output', default='bench_output.json')
+    parser.add_argument('--baseline', help='JSON file from a previous run to compare against')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='fail when a metric exceeds baseline * threshold')
+    parser.add_argument('--no-tracemalloc', action='store_true',
+                        help='skip the separate tracemalloc run')
+    parser.add_argument('--run-one', help=argparse.SUPPRESS)
+    parser.add_argument('--trace-memory', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(args.run_one, args.qualities[0], args.trace_memory)))
+        return 0
+
+    results = bench(args.scenes, args.qualities, trace_memory=not args.no_tracemalloc)
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print_table(results)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for key, metric, old, new in regressions:
+            print(f'REGRESSION {key} {metric}: {old} -> {new}', file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,25 +1,43 @@
 from manim import *
 from src.originsingle_vector import SingleVector
 from src.moving_point import MovingPoint
+from src.frame_dedupe import enable_frame_dedupe
+from src.tex_warmup import precompile_tex
+
+# 向量参数（construct 创建向量、setup 预编译标签都读这里）
+VECTOR = dict(
+    vector=[4, 2, 0],
+    color=BLUE,
+    start_label='O',
+    mid_label=r'\vec{v}',
+    end_label='A',
+    origin=ORIGIN
+)
+POINT_LABEL = 'P'
+POINT_COLOR = RED
 
 class TestMovingPoint(Scene):
+    # 打开后 wait 时画面不变，直接复用上一帧
+    use_frame_dedupe = False
+    
+    def setup(self):
+        # construct 之前一次性并行编译所有标签
+        precompile_tex(SingleVector.get_tex_items(**VECTOR) + [
+            {'tex_strings': POINT_LABEL, 'scale': 0.8, 'color': POINT_COLOR}
+        ])
+        if self.use_frame_dedupe:
+            enable_frame_dedupe(self)
+    
     def construct(self):
         # 1. 创建向量
-        vector = SingleVector(
-            vector=[4, 2, 0],
-            color= BLUE, 
-            start_label='O',
-            mid_label=r'\vec{v}',
-            end_label='A',
-            origin=ORIGIN
-            )
+        vector = SingleVector(**VECTOR)
         vector.show(self)
         
         # 2. 创建动点
         point = MovingPoint(
             line=vector,           # 在向量上移动
-            color=RED,             # 点颜色
-            point_label='P',       # 点标签
+            color=POINT_COLOR,     # 点颜色
+            point_label=POINT_LABEL,  # 点标签
             label_position=UP      # 标签在上方
         )
         
@@ -1,8 +1,16 @@
 from manim import *
 from src.originsingle_vector import SingleVector
 from src.moving_point import MovingPoint
+from src.frame_cache import enable_frame_cache
 class MovingOnLine(Scene):
     """在线段上移动"""
+    # 帧缓存上限（字节），0 表示不缓存；
+    # 打开后同一组位置走两遍以及停顿时，重复的帧直接复用
+    frame_cache_bytes = 0
+    
+    def setup(self):
+        if self.frame_cache_bytes:
+            enable_frame_cache(self, self.frame_cache_bytes)
     
     def construct(self):
         # 创建一条线段
@@ -40,4 +48,32 @@ class MovingOnLine(Scene):
         positions = [0, 0.3, 0.7, 0.5, 1, 0.2]
         point.move_along(positions, self)
         
-        self.wait(2)
\ No newline at end of file
+        self.wait(2)
+
+class MovingOnCurve(Scene):
+    """在曲线上移动"""
+    
+    def construct(self):
+        axes = Axes(
+            x_range=[-3, 3, 1],
+            y_range=[-1, 9, 1],
+            axis_config={"color": BLUE},
+        )
+        graph = axes.plot(lambda x: x**2, color=RED)
+        self.play(Create(axes), Create(graph))
+        
+        # 任意路径：弧长表只在创建时计算一次
+        point = MovingPoint(line=graph, color=YELLOW, point_label='P')
+        point.show(self)
+        
+        # 位置按弧长计算，linear 时就是匀速运动
+        point.move_to(1, self, run_time=4)
+        point.move_to(0.5, self, run_time=2)
+        self.wait(1)
+        
+        circle = Circle(radius=1.5, color=GREEN).shift(RIGHT * 3 + UP * 2)
+        self.play(Create(circle))
+        point2 = MovingPoint(line=circle, color=GREEN, point_label='Q', label_position=RIGHT)
+        point2.show(self)
+        point2.move_along([0.25, 0.5, 1], self, run_times=[1, 1, 2])
+        self.wait(2)
@@ -1,17 +1,33 @@
 from manim import *
 from src.originsingle_vector import SingleVector
 from src.moving_point import MovingPoint
+from src.frame_dedupe import enable_frame_dedupe
+from src.tex_warmup import precompile_tex
+
+# 向量和两个动点的参数（construct 创建对象、setup 预编译标签都读这里）
+VECTOR = ([3, 1, 0], BLUE, 'A', r'\overrightarrow{AB}', 'B')
+POINTS = [(RED, 'P_1', UP), (GREEN, 'P_2', DOWN)]
+
 class MultiplePoints(Scene):
     """多个动点"""
+    # 打开后 wait 时画面不变，直接复用上一帧
+    use_frame_dedupe = False
+    
+    def setup(self):
+        # construct 之前一次性并行编译所有标签
+        precompile_tex(SingleVector.get_tex_items(*VECTOR) + [
+            {'tex_strings': label, 'scale': 0.8, 'color': color} for color, label, _ in POINTS
+        ])
+        if self.use_frame_dedupe:
+            enable_frame_dedupe(self)
     
     def construct(self):
         # 创建向量
-        vector = SingleVector([3, 1, 0], BLUE, 'A', r'\overrightarrow{AB}', 'B')
+        vector = SingleVector(*VECTOR)
         vector.show(self)
         
         # 创建两个动点
-        point1 = MovingPoint(vector, RED, 'P_1', UP)
-        point2 = MovingPoint(vector, GREEN, 'P_2', DOWN)
+        point1, point2 = (MovingPoint(vector, *point) for point in POINTS)
         
         point1.show(self)
         point2.show(self)
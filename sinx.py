@@ -1,7 +1,24 @@
 from manim import *
+from src.streaming_path import StreamingPath
+from src.path_sampler import path_sampler
+from src.tex_warmup import precompile_tex
+from src.updater_profiler import install_updater_profiler
+from src.layer_cache import enable_layer_cache
 
 class SineCurveUnitCircle(Scene):
     # contributed by heejin_park, https://infograph.tistory.com/230
+    X_LABELS = [r"\pi", r"2 \pi", r"3 \pi", r"4 \pi"]
+    # 圆排在运动的点之后，打开后用缓存的图层合成，不再每帧重画
+    use_layer_cache = False
+    # 统计每个 updater 的耗时（None 时看环境变量 MANIM_PROFILE_UPDATERS）
+    profile_updaters = None
+
+    def setup(self):
+        precompile_tex(self.X_LABELS)
+        install_updater_profiler(self, enabled=self.profile_updaters)
+        if self.use_layer_cache:
+            enable_layer_cache(self)
+
     def construct(self):
         self.show_axis()
         self.show_circle()
@@ -25,10 +42,7 @@ class SineCurveUnitCircle(Scene):
         self.curve_start = np.array([-3,0,0])
 
     def add_x_labels(self):
-        x_labels = [
-            MathTex(r"\pi"), MathTex(r"2 \pi"),
-            MathTex(r"3 \pi"), MathTex(r"4 \pi"),
-        ]
+        x_labels = [MathTex(label) for label in self.X_LABELS]
 
         for i in range(len(x_labels)):
             x_labels[i].next_to(np.array([-1 + 2*i, 0, 0]), DOWN)
@@ -42,17 +56,18 @@ class SineCurveUnitCircle(Scene):
 
     def move_dot_and_draw_curve(self):
         orbit = self.circle
+        orbit_sampler = path_sampler(orbit)
         origin_point = self.origin_point
 
         dot = Dot(radius=0.08, color=YELLOW)
-        dot.move_to(orbit.point_from_proportion(0))
+        dot.move_to(orbit_sampler.point_at(0))
         self.t_offset = 0
         rate = 0.25
 
         def go_around_circle(mob, dt):
             self.t_offset += (dt * rate)
             # print(self.t_offset)
-            mob.move_to(orbit.point_from_proportion(self.t_offset % 1))
+            mob.move_to(orbit_sampler.point_at(self.t_offset % 1))
 
         def get_line_to_circle():
             return Line(origin_point, dot.get_center(), color=BLUE)
@@ -63,25 +78,20 @@ class SineCurveUnitCircle(Scene):
             return Line(dot.get_center(), np.array([x,y,0]), color=YELLOW_A, stroke_width=2 )
 
 
-        self.curve = VGroup()
-        self.curve.add(Line(self.curve_start,self.curve_start))
-        def get_curve():
-            last_line = self.curve[-1]
+        self.curve = StreamingPath(self.curve_start, stroke_color=YELLOW_D, max_points=1024)
+        def update_curve(curve):
             x = self.curve_start[0] + self.t_offset * 4
             y = dot.get_center()[1]
-            new_line = Line(last_line.get_end(),np.array([x,y,0]), color=YELLOW_D)
-            self.curve.add(new_line)
-
-            return self.curve
+            curve.add_sample(np.array([x,y,0]))
 
         dot.add_updater(go_around_circle)
 
         origin_to_circle_line = always_redraw(get_line_to_circle)
         dot_to_curve_line = always_redraw(get_line_to_curve)
-        sine_curve_line = always_redraw(get_curve)
+        self.curve.add_updater(update_curve)
 
         self.add(dot)
-        self.add(orbit, origin_to_circle_line, dot_to_curve_line, sine_curve_line)
+        self.add(orbit, origin_to_circle_line, dot_to_curve_line, self.curve)
         self.wait(8.5)
 
         dot.remove_updater(go_around_circle)
\ No newline at end of file
@@ -0,0 +1,187 @@
+# batch_render.py
+from manim import *
+import manim
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import hashlib
+import json
+import os
+import time
+
+from src.render_options import QUALITIES, save_manifest
+from src.scene_runner import render_scene, get_output_file, ensure_repo_on_path
+from src.tex_warmup import precompile_tex
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# VectorDiagramConfig 中表示向量的字段
+VECTOR_FIELDS = ('vec_a', 'vec_b', 'shift_amount')
+
+
+def load_configs(path):
+    """
+    读取配置列表文件（.json / .yaml / .yml）
+
+    文件内容是一个列表，每一项是 VectorDiagramConfig 的参数，例如:
+        [{"colors": {"a": "TEAL"}, "labels": {"point": "Q"}},
+         {"vec_a": [2, 1, 0], "vec_b": [-1, 3, 0], "shift_amount": "UP"}]
+    """
+    with open(path) as f:
+        if path.endswith(('.yaml', '.yml')):
+            if yaml is None:
+                raise ImportError("PyYAML is required to read YAML configs (pip install pyyaml)")
+            entries = yaml.safe_load(f)
+        else:
+            entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"{path} should contain a list of configs")
+    return entries
+
+
+def config_hash(entry):
+    """配置内容的哈希（键顺序无关），用于命名输出文件和记录清单"""
+    text = json.dumps(entry, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode()).hexdigest()[:12]
+
+
+def _resolve_constant(value):
+    """把 'TEAL'、'UP' 这样的名字换成 manim 中的常量"""
+    if isinstance(value, str) and hasattr(manim, value):
+        return getattr(manim, value)
+    return value
+
+
+def build_config(entry):
+    """
+    把一条文件中的配置转换成 VectorDiagramConfig
+
+    - 向量字段：列表转成 np.array，字符串按 manim 常量解析（如 "DOWN"）
+    - 颜色：manim 颜色名（如 "TEAL"）或十六进制字符串（如 "#FF8800"）
+    """
+    from vectorclass import VectorDiagramConfig
+
+    kwargs = dict(entry)
+    for field in VECTOR_FIELDS:
+        if field in kwargs:
+            kwargs[field] = np.array(_resolve_constant(kwargs[field]), dtype=float)
+    if 'colors' in kwargs:
+        kwargs['colors'] = {
+            key: _resolve_constant(color) for key, color in kwargs['colors'].items()
+        }
+    return VectorDiagramConfig(**kwargs)
+
+
+def _render_entry(key, entry, config_overrides):
+    """子进程：渲染一个配置（进程会被复用，manim 只导入一次）"""
+    ensure_repo_on_path()
+    overrides = dict(config_overrides)
+    overrides['output_file'] = f'FlexibleVectorDiagram_{key}'
+    # 所有变体都是 vectorclass.FlexibleVectorDiagram，默认共用一个片段目录；
+    # 并行合并片段时会互相覆盖 partial_movie_file_list.txt，
+    # clean_cache 也会删掉别的进程的片段，所以每个变体用自己的目录
+    overrides['partial_movie_dir'] = f'{{video_dir}}/partial_movie_files/FlexibleVectorDiagram_{key}'
+    start = time.perf_counter()
+    scene = render_scene(
+        'vectorclass', 'FlexibleVectorDiagram', overrides,
+        scene_kwargs={'config': build_config(entry)}
+    )
+    return key, get_output_file(scene), time.perf_counter() - start
+
+
+def load_manifest(path):
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    return {}
+
+
+def render_batch(entries, manifest_path='batch_manifest.json', workers=None, quality='low',
+                 config_overrides=None, force=False):
+    """
+    用进程池批量渲染多个 VectorDiagramConfig 变体
+
+    先在当前进程并行编译所有变体用到的标签（写入共享的 Tex 目录和 tex_cache），
+    然后把各个变体分给进程池渲染。清单把配置哈希映射到输出文件，
+    已经渲染过、输出文件仍然存在的配置会被跳过。
+
+    参数:
+    - entries: 配置列表（load_configs 的返回值）
+    - manifest_path: 清单文件路径
+    - workers: 进程数（默认 CPU 核数）
+    - quality: 'low' / 'medium' / 'high' / 'production'
+    - config_overrides: 其他 manim 配置
+    - force: 忽略清单，全部重新渲染
+
+    返回: 清单字典 {配置哈希: {'output': ..., 'config': ..., 'render_time': ...}}
+    """
+    overrides = {'quality': QUALITIES.get(quality, quality)}
+    overrides.update(config_overrides or {})
+
+    manifest = load_manifest(manifest_path)
+    pending = {}
+    for entry in entries:
+        key = config_hash(entry)
+        done = manifest.get(key)
+        if not force and done and done.get('output') and os.path.exists(done['output']):
+            continue
+        pending[key] = entry
+
+    if not pending:
+        logger.info("All %d configs are already rendered", len(entries))
+        return manifest
+
+    # 所有变体的标签一起编译，重复的标签只编译一次
+    ensure_repo_on_path()
+    with tempconfig(overrides):
+        tex_items = []
+        for entry in pending.values():
+            tex_items.extend(build_config(entry).get_tex_items())
+        precompile_tex(tex_items, workers)
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_render_entry, key, entry, overrides): key
+            for key, entry in pending.items()
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                key, output, elapsed = future.result()
+            except Exception as error:
+                logger.error("Config %s failed: %s", key, error)
+                manifest[key] = {'config': pending[key], 'error': str(error)}
+            else:
+                logger.info("Config %s rendered in %.2fs -> %s", key, elapsed, output)
+                manifest[key] = {
+                    'config': pending[key],
+                    'output': output,
+                    'render_time': elapsed,
+                }
+            save_manifest(manifest, manifest_path)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render a list of VectorDiagramConfig variants.')
+    parser.add_argument('configs', help='JSON or YAML file with a list of configs')
+    parser.add_argument('-m', '--manifest', default='batch_manifest.json')
+    parser.add_argument('-w', '--workers', type=int, default=None)
+    parser.add_argument('-q', '--quality', default='low', choices=list(QUALITIES))
+    parser.add_argument('--force', action='store_true', help='re-render configs already in the manifest')
+    args = parser.parse_args()
+
+    manifest = render_batch(
+        load_configs(args.configs), args.manifest, args.workers, args.quality, force=args.force
+    )
+    failed = [key for key, item in manifest.items() if 'error' in item]
+    print(f'{len(manifest) - len(failed)} rendered, {len(failed)} failed, manifest: {args.manifest}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,167 @@
+# frame_cache.py
+from manim import *
+from collections import OrderedDict
+import hashlib
+import numpy as np
+
+
+class FrameCache:
+    """按 ValueTracker 取值缓存光栅化后的帧
+
+    在只有跟踪器动画（tracker.animate.set_value 等）和 Wait 的 play 中，
+    如果画面完全由跟踪器的值决定，那么跟踪器回到之前到过的值时，
+    画面也和之前一样。这时直接复用缓存的帧，不再重新绘制。
+
+    缓存键 = 本次 play 的静态场景哈希 + 所有跟踪器取值（按 quantum 量化）。
+    缓存按字节数上限做 LRU 淘汰。
+
+    前提：场景中带 updater 的对象只依赖跟踪器的值（always_redraw 和
+    MovingPoint 都满足）。有时间相关 updater（带 dt 参数）或场景级 updater
+    的 play 不会使用缓存。
+    """
+
+    def __init__(self, scene, max_bytes=256 * 2**20, quantum=1e-4):
+        """
+        参数:
+        - scene: 场景对象
+        - max_bytes: 缓存帧的总字节数上限
+        - quantum: 跟踪器取值的量化步长，差距小于它的取值视为同一帧
+        """
+        self.scene = scene
+        self.max_bytes = max_bytes
+        self.quantum = quantum
+        self.frames = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._play_index = None
+        self._static_key = None
+        self._trackers = []
+
+    def install(self):
+        """替换渲染器的 render，先查缓存再绘制"""
+        renderer = self.scene.renderer
+        render = renderer.render
+
+        def cached_render(scene, time, moving_mobjects):
+            if renderer.num_plays != self._play_index:
+                self._begin_play()
+            if self._static_key is None:
+                render(scene, time, moving_mobjects)
+                return
+
+            key = self._get_key()
+            frame = self.frames.get(key)
+            if frame is not None:
+                self.frames.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+                renderer.update_frame(scene, moving_mobjects)
+                frame = renderer.get_frame()
+                self._store(key, frame)
+            renderer.add_frame(frame)
+
+        renderer.render = cached_render
+        return self
+
+    def _begin_play(self):
+        """每次 play 的第一帧：判断能否使用缓存，计算静态场景哈希"""
+        scene = self.scene
+        self._play_index = scene.renderer.num_plays
+        self._static_key = None
+        if not self._is_cacheable():
+            return
+        self._trackers = self._find_trackers()
+        self._static_key = self._hash_static_scene()
+
+    def _is_cacheable(self):
+        scene = self.scene
+        if scene.updaters:
+            return False
+        if not all(self._is_tracker_animation(animation) for animation in scene.animations):
+            return False
+        for mobject in scene.mobjects:
+            if any(member.has_time_based_updater() for member in mobject.get_family()):
+                return False
+        return True
+
+    def _is_tracker_animation(self, animation):
+        if isinstance(animation, Wait):
+            return True
+        if hasattr(animation, 'animations'):
+            return all(self._is_tracker_animation(sub) for sub in animation.animations)
+        return isinstance(animation.mobject, ValueTracker)
+
+    def _find_trackers(self):
+        """场景中和场景属性上的所有跟踪器（顺序固定）"""
+        trackers = {}
+        for mobject in self.scene.mobjects:
+            for member in mobject.get_family():
+                if isinstance(member, ValueTracker):
+                    trackers[id(member)] = member
+        for value in vars(self.scene).values():
+            if isinstance(value, ValueTracker):
+                trackers.setdefault(id(value), value)
+        return list(trackers.values())
+
+    def _hash_static_scene(self):
+        """
+        不带 updater 的对象按点和颜色数据哈希；
+        带 updater 的对象由跟踪器决定，只记录它在场景中的位置
+        """
+        digest = hashlib.sha1()
+        for mobject in self.scene.mobjects:
+            family = mobject.get_family()
+            digest.update(f'{type(mobject).__name__}:{id(mobject)};'.encode())
+            if any(member.updaters for member in family):
+                continue
+            for member in family:
+                digest.update(member.points.tobytes())
+                for name in ('fill_rgbas', 'stroke_rgbas', 'background_stroke_rgbas'):
+                    array = getattr(member, name, None)
+                    if array is not None:
+                        digest.update(np.asarray(array).tobytes())
+                digest.update(repr(getattr(member, 'stroke_width', None)).encode())
+        return digest.hexdigest()
+
+    def _get_key(self):
+        if not self._trackers:
+            return self._static_key, ()
+        values = np.concatenate([tracker.points[0] for tracker in self._trackers])
+        return self._static_key, tuple(np.round(values / self.quantum).astype(np.int64))
+
+    def _store(self, key, frame):
+        if frame.nbytes > self.max_bytes:
+            return
+        self.frames[key] = frame
+        self.nbytes += frame.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self.frames.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def stats(self):
+        """命中率统计"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'frames': len(self.frames),
+            'bytes': self.nbytes,
+        }
+
+
+def enable_frame_cache(scene, max_bytes=256 * 2**20, quantum=1e-4):
+    """
+    给场景开启按跟踪器取值的帧缓存
+
+    参数:
+    - scene: 场景对象（会替换它的 renderer.render）
+    - max_bytes: 缓存帧的总字节数上限
+    - quantum: 跟踪器取值的量化步长
+
+    返回: FrameCache 对象（可用 stats() 查看命中率）
+    """
+    return FrameCache(scene, max_bytes, quantum).install()
@@ -0,0 +1,101 @@
+# frame_dedupe.py
+from manim import *
+import hashlib
+import numpy as np
+
+# 参与哈希的样式数组
+_STYLE_ATTRIBUTES = ('fill_rgbas', 'stroke_rgbas', 'background_stroke_rgbas', 'pixel_array')
+
+
+class FrameDedupe:
+    """跳过与上一帧完全相同的帧
+
+    只要场景里有 always_redraw 或其他 updater，wait 就不能使用 manim 的静止帧，
+    每一帧都会重新光栅化，即使 updater 重建出的画面和上一帧一模一样。
+
+    这里每帧先对运动对象的点数据和样式做一次哈希，和同一次 play 中上一帧相同时，
+    直接把上一帧再写一次，不再光栅化。
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.reused = 0
+        self.rendered = 0
+
+        self._play_index = None
+        self._last_hash = None
+        self._last_frame = None
+
+    def install(self):
+        """替换渲染器的 render 和 add_frame"""
+        renderer = self.scene.renderer
+        render = renderer.render
+        add_frame = renderer.add_frame
+
+        def recording_add_frame(frame, num_frames=1):
+            self._last_frame = frame
+            add_frame(frame, num_frames)
+
+        def dedupe_render(scene, time, moving_mobjects):
+            state_hash = self._hash_state(moving_mobjects)
+            if (
+                renderer.num_plays == self._play_index
+                and state_hash == self._last_hash
+                and self._last_frame is not None
+            ):
+                self.reused += 1
+                add_frame(self._last_frame)
+                return
+
+            self._play_index = renderer.num_plays
+            self._last_hash = state_hash
+            self._last_frame = None
+            self.rendered += 1
+            render(scene, time, moving_mobjects)
+
+        renderer.add_frame = recording_add_frame
+        renderer.render = dedupe_render
+        return self
+
+    @staticmethod
+    def _hash_state(mobjects):
+        """运动对象（含当前的子对象）的点数据和样式的哈希"""
+        digest = hashlib.blake2b(digest_size=16)
+        seen = set()
+        for mobject in mobjects:
+            for member in mobject.get_family():
+                if id(member) in seen:
+                    continue
+                seen.add(id(member))
+                digest.update(type(member).__name__.encode())
+                digest.update(np.ascontiguousarray(member.points).data)
+                for name in _STYLE_ATTRIBUTES:
+                    array = getattr(member, name, None)
+                    if isinstance(array, np.ndarray):
+                        digest.update(np.ascontiguousarray(array).data)
+                digest.update(repr((
+                    getattr(member, 'stroke_width', None),
+                    getattr(member, 'background_stroke_width', None),
+                    member.z_index,
+                )).encode())
+        return digest.digest()
+
+    def stats(self):
+        total = self.reused + self.rendered
+        return {
+            'rendered': self.rendered,
+            'reused': self.reused,
+            'reuse_rate': self.reused / total if total else 0.0,
+        }
+
+
+def enable_frame_dedupe(scene):
+    """
+    给场景开启重复帧检测
+
+    参数:
+    - scene: 场景对象（会替换它的 renderer.render 和 renderer.add_frame）
+
+    返回: FrameDedupe 对象（可用 stats() 查看复用了多少帧）
+    """
+    return FrameDedupe(scene).install()
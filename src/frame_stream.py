@@ -0,0 +1,198 @@
+# frame_stream.py
+from manim import *
+import argparse
+import numpy as np
+import os
+import shutil
+import socket
+import stat
+import subprocess
+import sys
+
+from src.render_options import QUALITIES
+from src.scene_runner import render_scene
+
+
+class FrameStream:
+    """把渲染出的帧实时写到标准输出、命名管道或 TCP 连接
+
+    不编码时写原始 RGBA 帧（每帧 width * height * 4 字节），
+    编码时通过 ffmpeg 输出低延迟的 H.264 MPEG-TS 流。
+    """
+
+    def __init__(self, target='-', width=None, height=None, frame_rate=None, encode=False):
+        """
+        参数:
+        - target: '-' 表示标准输出；'tcp://host:port' 表示监听端口等待播放器连接；
+          其他字符串表示文件路径（不存在时创建命名管道）
+        - width, height, frame_rate: 帧尺寸和帧率（默认取 manim 配置）
+        - encode: 是否用 ffmpeg 编码
+        """
+        self.target = target
+        self.width = width or config.pixel_width
+        self.height = height or config.pixel_height
+        self.frame_rate = frame_rate or config.frame_rate
+        self.encode = encode
+        self.frames_written = 0
+        self.broken = False
+
+        self._sink = None
+        self._connection = None
+        self._server = None
+        self._encoder = None
+
+    def describe(self):
+        """给播放器的格式说明"""
+        if self.encode:
+            return 'mpegts (h264)'
+        return f'rawvideo rgba {self.width}x{self.height} @ {self.frame_rate} fps'
+
+    def open(self):
+        """打开输出（TCP 和命名管道会阻塞到有读取方连上）"""
+        if self.target == '-':
+            self._sink = sys.stdout.buffer
+        elif self.target.startswith('tcp://'):
+            host, port = self.target[len('tcp://'):].rsplit(':', 1)
+            self._server = socket.create_server((host, int(port)))
+            logger.info("Waiting for a client on %s (%s)", self.target, self.describe())
+            self._connection, _ = self._server.accept()
+            self._sink = self._connection.makefile('wb')
+        else:
+            if not os.path.exists(self.target):
+                os.mkfifo(self.target)
+            if stat.S_ISFIFO(os.stat(self.target).st_mode):
+                logger.info("Waiting for a reader on %s (%s)", self.target, self.describe())
+            self._sink = open(self.target, 'wb')
+
+        if self.encode:
+            self._start_encoder()
+        return self
+
+    def _start_encoder(self):
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg was not found on PATH, stream raw frames instead")
+        self._sink.flush()
+        command = [
+            ffmpeg, '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgba',
+            '-s', f'{self.width}x{self.height}', '-r', str(self.frame_rate),
+            '-i', '-', '-an',
+            '-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'zerolatency',
+            '-pix_fmt', 'yuv420p', '-f', 'mpegts', 'pipe:1',
+        ]
+        self._encoder = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=self._sink.fileno())
+
+    def write(self, frame, num_frames=1):
+        """写入一帧（重复 num_frames 次）"""
+        if self.broken:
+            return
+        frame = np.ascontiguousarray(frame)
+        sink = self._encoder.stdin if self._encoder else self._sink
+        try:
+            for _ in range(num_frames):
+                sink.write(memoryview(frame).cast('B'))
+            sink.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # 播放器关闭后继续渲染，只是不再输出
+            self.broken = True
+            logger.warning("Frame stream closed by the reader after %d frames", self.frames_written)
+            return
+        self.frames_written += num_frames
+
+    def close(self):
+        if self._encoder:
+            try:
+                self._encoder.stdin.close()
+            except BrokenPipeError:
+                pass
+            self._encoder.wait()
+            self._encoder = None
+        if self._sink is not None and self._sink is not sys.stdout.buffer:
+            try:
+                self._sink.close()
+            except BrokenPipeError:
+                pass
+        elif self._sink is not None and not self.broken:
+            try:
+                self._sink.flush()
+            except BrokenPipeError:
+                pass
+        if self._connection:
+            self._connection.close()
+        if self._server:
+            self._server.close()
+        self._sink = self._connection = self._server = None
+
+
+def enable_frame_stream(scene, target='-', encode=False):
+    """
+    让场景在写入视频的同时把每一帧写到流里
+
+    参数:
+    - scene: 要推流的场景（在 render 之前调用，会替换 renderer.file_writer.write_frame）
+    - target: 输出位置，见 FrameStream
+    - encode: 是否用 ffmpeg 编码
+
+    返回: 已打开的 FrameStream（场景结束时自动关闭）
+    """
+    renderer = scene.renderer
+    camera = renderer.camera
+    stream = FrameStream(
+        target, camera.pixel_width, camera.pixel_height, camera.frame_rate, encode
+    ).open()
+
+    file_writer = renderer.file_writer
+    write_frame = file_writer.write_frame
+    scene_finished = renderer.scene_finished
+
+    def streaming_write_frame(frame, num_frames=1):
+        stream.write(frame, num_frames)
+        write_frame(frame, num_frames)
+
+    def streaming_scene_finished(scene):
+        try:
+            scene_finished(scene)
+        finally:
+            stream.close()
+
+    file_writer.write_frame = streaming_write_frame
+    renderer.scene_finished = streaming_scene_finished
+    return stream
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream the frames of a scene while it renders.')
+    parser.add_argument('module', help="scene module, e.g. 'sinx'")
+    parser.add_argument('scene', help="scene class, e.g. 'SineCurveUnitCircle'")
+    parser.add_argument('--to', default='-', help="'-' (stdout), 'tcp://127.0.0.1:9000' or a fifo path")
+    parser.add_argument('--encode', action='store_true', help='encode to h264 mpegts with ffmpeg')
+    parser.add_argument('--no-movie', action='store_true', help='do not write the movie file')
+    parser.add_argument('-q', '--quality', default='low', choices=list(QUALITIES))
+    args = parser.parse_args()
+
+    overrides = {
+        'quality': QUALITIES[args.quality],
+        # 命中片段缓存的 play 不会产生帧
+        'disable_caching': True,
+        'progress_bar': 'none',
+    }
+    if args.no_movie:
+        overrides['write_to_movie'] = False
+    if args.to == '-':
+        # manim 的日志也写到标准输出，会混进帧数据
+        overrides['verbosity'] = 'CRITICAL'
+
+    streams = []
+
+    def before_render(scene):
+        stream = enable_frame_stream(scene, args.to, args.encode)
+        print(f'streaming {stream.describe()} to {args.to}', file=sys.stderr, flush=True)
+        streams.append(stream)
+
+    render_scene(args.module, args.scene, overrides, before_render=before_render)
+    print(f'{streams[0].frames_written} frames streamed', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+# keyframe_export.py
+from manim import *
+import argparse
+import numpy as np
+import os
+
+from src.render_options import QUALITIES
+from src.scene_runner import render_scene
+
+# 判断相邻两段曲线是否首尾相接（像素）
+_JOIN_TOLERANCE = 1e-3
+
+
+def _format_number(value):
+    return '%.6g' % round(float(value), 2)
+
+
+def _format_color(rgba):
+    """rgba（0~1）-> ('#rrggbb', 不透明度)"""
+    r, g, b = (int(round(c * 255)) for c in rgba[:3])
+    return '#%02x%02x%02x' % (r, g, b), round(float(rgba[3]), 3)
+
+
+class KeyframeRecorder:
+    """记录每一帧中每条路径的形状和样式，导出为动画 SVG，不做任何光栅化
+
+    替换渲染器的 render / freeze_current_frame / save_static_frame_data：
+    每帧只把当前所有 VMobject 的贝塞尔点转成 SVG 路径字符串，
+    不画像素、不编码视频。同一个对象点数据没变时直接复用上一帧的字符串。
+
+    导出时每条路径的属性只在发生变化的时刻写一个关键帧（SMIL discrete 动画），
+    静止的部分不会重复写入，浏览器负责播放。
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        camera = scene.renderer.camera
+        self.frame_rate = camera.frame_rate
+        self.pixel_width = camera.pixel_width
+        self.pixel_height = camera.pixel_height
+        self.background = _format_color(
+            np.append(color_to_rgb(camera.background_color), camera.background_opacity)
+        )
+
+        # 帧坐标 -> 像素坐标（与 Camera.get_cairo_context 的变换相同）
+        self._scale = np.array([
+            camera.pixel_width / camera.frame_width,
+            -camera.pixel_height / camera.frame_height,
+        ])
+        self._offset = np.array([
+            camera.pixel_width / 2 - camera.frame_center[0] * self._scale[0],
+            camera.pixel_height / 2 - camera.frame_center[1] * self._scale[1],
+        ])
+        self._line_width_scale = camera.cairo_line_width_multiple * self._scale[0]
+
+        # 每一帧: (帧数, {元素键: 状态})
+        self.frames = []
+        self._paths = {}
+        self._previous_paths = {}
+        self._skipped_types = set()
+
+    def install(self):
+        renderer = self.scene.renderer
+
+        def recording_render(scene, time, moving_mobjects):
+            self._record(1)
+
+        def recording_freeze_current_frame(duration):
+            self._record(int(duration * self.frame_rate))
+
+        def skipping_save_static_frame_data(scene, static_mobjects):
+            renderer.static_image = None
+            return None
+
+        renderer.render = recording_render
+        renderer.freeze_current_frame = recording_freeze_current_frame
+        renderer.save_static_frame_data = skipping_save_static_frame_data
+        return self
+
+    def _record(self, num_frames):
+        renderer = self.scene.renderer
+        if renderer.skip_animations or num_frames <= 0:
+            return
+        renderer.time += num_frames / self.frame_rate
+        self.frames.append((num_frames, self._capture()))
+
+    def _capture(self):
+        """当前画面中所有路径的状态"""
+        scene = self.scene
+        mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        # 与相机相同：按 z_index 稳定排序
+        mobjects = sorted(mobjects, key=lambda mob: mob.z_index)
+
+        state = {}
+        seen = set()
+        paths, self._previous_paths = {}, self._paths
+        for top in mobjects:
+            for index, member in enumerate(top.family_members_with_points()):
+                if id(member) in seen:
+                    continue
+                seen.add(id(member))
+                if not isinstance(member, VMobject):
+                    self._skipped_types.add(type(member).__name__)
+                    continue
+                style = self._get_style(member)
+                if style is None:
+                    continue
+                # 键用 (顶层对象, 在家族中的序号)，always_redraw 每帧新建的子对象也能对上
+                state[id(top), index] = (self._get_path(member, paths),) + style
+        # 只保留这一帧用到的路径，always_redraw 每帧新建的对象不会越积越多
+        self._paths = paths
+        return state
+
+    def _get_path(self, vmobject, paths):
+        """点数据没变时复用上一帧生成的路径字符串"""
+        points = vmobject.points
+        cached = self._previous_paths.get(id(vmobject))
+        if cached is not None and np.array_equal(cached[0], points):
+            path = cached[1]
+        else:
+            path = self._path_data(points)
+        paths[id(vmobject)] = (points.copy(), path)
+        return path
+
+    def _path_data(self, points):
+        """贝塞尔点 -> SVG 路径字符串（像素坐标）"""
+        count = len(points) - len(points) % 4
+        curves = points[:count, :2].reshape(-1, 4, 2) * self._scale + self._offset
+        parts = []
+        start = end = None
+        for curve in curves:
+            if end is None or np.abs(curve[0] - end).max() > _JOIN_TOLERANCE:
+                if start is not None and np.abs(start - end).max() <= _JOIN_TOLERANCE:
+                    parts.append('Z')
+                start = curve[0]
+                parts.append('M%s %s' % (_format_number(start[0]), _format_number(start[1])))
+            parts.append('C' + ' '.join(_format_number(v) for v in curve[1:].ravel()))
+            end = curve[3]
+        if start is not None and np.abs(start - end).max() <= _JOIN_TOLERANCE:
+            parts.append('Z')
+        return ''.join(parts)
+
+    def _get_style(self, vmobject):
+        """(填充色, 填充不透明度, 线条色, 线条不透明度, 线宽)，完全不可见时返回 None"""
+        fill, fill_opacity = _format_color(vmobject.get_fill_rgbas()[0])
+        stroke, stroke_opacity = _format_color(vmobject.get_stroke_rgbas()[0])
+        width = vmobject.get_stroke_width()
+        if width == 0 or stroke_opacity == 0:
+            stroke, stroke_opacity, width = 'none', 0, 0
+        if fill_opacity == 0:
+            fill = 'none'
+        if fill == 'none' and stroke == 'none':
+            return None
+        return fill, fill_opacity, stroke, stroke_opacity, round(width * self._line_width_scale, 3)
+
+    def get_duration(self):
+        return sum(num_frames for num_frames, _ in self.frames) / self.frame_rate
+
+    def _get_element_order(self):
+        """所有出现过的元素的绘制顺序（新元素插在它在当前帧中的前一个元素之后）"""
+        order = []
+        known = set()
+        for _, state in self.frames:
+            if known.issuperset(state):
+                continue
+            position = 0
+            for key in state:
+                if key in known:
+                    position = order.index(key) + 1
+                else:
+                    order.insert(position, key)
+                    known.add(key)
+                    position += 1
+        return order
+
+    def to_svg(self, loop=True):
+        """生成动画 SVG 文本"""
+        if self.frames:
+            total_frames = sum(num_frames for num_frames, _ in self.frames)
+        else:
+            total_frames = 1
+        duration = total_frames / self.frame_rate
+        key_times = []
+        elapsed = 0
+        for num_frames, _ in self.frames:
+            key_times.append(elapsed / total_frames)
+            elapsed += num_frames
+
+        repeat = 'repeatCount="indefinite"' if loop else 'fill="freeze"'
+        attributes = ('d', 'fill', 'fill-opacity', 'stroke', 'stroke-opacity', 'stroke-width')
+        lines = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {self.pixel_width} {self.pixel_height}" '
+            f'width="{self.pixel_width}" height="{self.pixel_height}">',
+            f'<rect width="100%" height="100%" fill="{self.background[0]}" '
+            f'fill-opacity="{self.background[1]}"/>',
+        ]
+        for key in self._get_element_order():
+            states = [state.get(key) for _, state in self.frames]
+            first = next(state for state in states if state is not None)
+            animations = []
+            visible = ['inline' if state is not None else 'none' for state in states]
+            if 'none' in visible:
+                animations.append(self._animate('display', visible, key_times, duration, repeat))
+            for index, name in enumerate(attributes):
+                values = [str((state or first)[index]) for state in states]
+                if any(value != values[0] for value in values):
+                    animations.append(self._animate(name, values, key_times, duration, repeat))
+
+            static = ' '.join(
+                f'{name}="{value}"' for name, value in zip(attributes, first)
+            )
+            if visible[0] == 'none':
+                static += ' display="none"'
+            if animations:
+                lines.append(f'<path {static}>')
+                lines.extend(animations)
+                lines.append('</path>')
+            else:
+                lines.append(f'<path {static}/>')
+        lines.append('</svg>')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _animate(name, values, key_times, duration, repeat):
+        """只在值变化的时刻写关键帧"""
+        times, changes = [], []
+        for time, value in zip(key_times, values):
+            if not changes or value != changes[-1]:
+                times.append(time)
+                changes.append(value)
+        return (
+            f'<animate attributeName="{name}" calcMode="discrete" dur="{duration:.6g}s" {repeat} '
+            f'keyTimes="{";".join("%.6g" % time for time in times)}" values="{";".join(changes)}"/>'
+        )
+
+    def save_svg(self, path, loop=True):
+        """写出 SVG 文件，返回路径"""
+        if self._skipped_types:
+            logger.warning(
+                "Keyframe export skipped non-vector mobjects: %s", ', '.join(sorted(self._skipped_types))
+            )
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(self.to_svg(loop))
+        return path
+
+
+def enable_keyframe_export(scene):
+    """
+    让场景只记录矢量关键帧，不光栅化
+
+    参数:
+    - scene: 要导出的场景，scene.renderer 必须已经存在
+
+    返回: KeyframeRecorder（渲染完后调用 save_svg 写出文件）。
+    应同时设置 write_to_movie=False、disable_caching=True，
+    否则会写出空视频，或命中缓存的 play 不会被记录。
+    """
+    return KeyframeRecorder(scene).install()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export a scene as an animated SVG instead of a video.')
+    parser.add_argument('module', help="scene module, e.g. 'vectorclass'")
+    parser.add_argument('scene', help="scene class, e.g. 'FlexibleVectorDiagram'")
+    parser.add_argument('-o', '--output', help='output file (default: media_dir/keyframes/<scene>.svg)')
+    parser.add_argument('--fps', type=int, help='keyframe rate (default: the quality frame rate)')
+    parser.add_argument('--no-loop', action='store_true', help='play once and hold the last frame')
+    parser.add_argument('-q', '--quality', default='medium', choices=list(QUALITIES))
+    args = parser.parse_args()
+
+    overrides = {
+        'quality': QUALITIES[args.quality],
+        'write_to_movie': False,
+        'save_last_frame': False,
+        'disable_caching': True,
+    }
+    if args.fps:
+        overrides['frame_rate'] = args.fps
+
+    recorders = []
+
+    def before_render(scene):
+        recorders.append(enable_keyframe_export(scene))
+
+    render_scene(args.module, args.scene, overrides, before_render=before_render)
+    recorder = recorders[0]
+    output = args.output or os.path.join(config.media_dir, 'keyframes', f'{args.scene}.svg')
+    recorder.save_svg(output, loop=not args.no_loop)
+    print(f'{output}: {len(recorder.frames)} frames, {recorder.get_duration():.2f} s, '
+          f'{os.path.getsize(output) / 1024:.1f} KiB')
+
+
+if __name__ == '__main__':
+    main()
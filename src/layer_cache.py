@@ -0,0 +1,151 @@
+# layer_cache.py
+from manim import *
+import numpy as np
+
+
+class LayerCache:
+    """把静止的对象预先画成图层，每帧只重画运动的对象
+
+    manim 只缓存场景中第一个运动对象之前的静止对象（static_image），
+    排在运动对象之后的静止对象（例如 sinx 中圆排在点的后面）每一帧都会重新光栅化。
+
+    这里在每次 play 开始时把 scene.moving_mobjects（已经展开成家族成员，
+    从第一个运动的成员开始）按顺序分成若干段：
+    - 运动段：被当前动画使用或带 updater（含祖先的 updater）的成员，每帧照常绘制；
+    - 静止段：只在 play 开始时画一次（只画成员自身，不含子对象），存成透明图层
+      （预乘 alpha），每帧在对应位置用 "over" 合成，保持原来的前后顺序。
+    按家族成员而不是顶层对象分段，已经画进 static_image 的成员不会再画一次。
+
+    使用 z_index 时绘制顺序不再是列表顺序，这种情况下不分层。
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.runs = None
+        self.layers_drawn = 0
+
+    def install(self):
+        """替换渲染器的 save_static_frame_data 和 update_frame"""
+        renderer = self.scene.renderer
+        save_static_frame_data = renderer.save_static_frame_data
+        update_frame = renderer.update_frame
+
+        def layered_save_static_frame_data(scene, static_mobjects):
+            result = save_static_frame_data(scene, static_mobjects)
+            self.runs = None if renderer.skip_animations else self._build_runs()
+            return result
+
+        def layered_update_frame(scene, mobjects=None, include_submobjects=True,
+                                 ignore_skipping=True, **kwargs):
+            # 只处理每帧绘制运动对象的调用，其余调用（静态帧、最后一帧等）照旧
+            if (
+                self.runs is None
+                or mobjects is not scene.moving_mobjects
+                or (renderer.skip_animations and not ignore_skipping)
+            ):
+                return update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+
+            camera = renderer.camera
+            if renderer.static_image is not None:
+                camera.set_frame_to_background(renderer.static_image)
+            else:
+                camera.reset()
+            for is_static, item in self.runs:
+                if is_static:
+                    self._composite(camera.pixel_array, item)
+                else:
+                    camera.capture_mobjects(item, include_submobjects=include_submobjects, **kwargs)
+
+        renderer.save_static_frame_data = layered_save_static_frame_data
+        renderer.update_frame = layered_update_frame
+        return self
+
+    def _build_runs(self):
+        """
+        把运动部分的家族成员按顺序分成运动段和静止段
+
+        返回: [(是否静止, 成员列表或图层), ...]；没有可以缓存的静止段时返回 None
+        """
+        scene = self.scene
+        if scene.updaters or not scene.moving_mobjects:
+            return None
+
+        top_level = list(scene.mobjects) + [
+            mob for mob in scene.foreground_mobjects if mob not in scene.mobjects
+        ]
+        if scene.renderer.camera.use_z_index and any(
+            member.z_index != 0 for mob in top_level for member in mob.get_family()
+        ):
+            return None
+
+        # 运动的成员：动画对象和带 updater 的成员，连同它们的整个家族
+        members = scene.moving_mobjects
+        dynamic = set()
+        for animation in scene.animations:
+            if animation.mobject is not None:
+                dynamic.update(id(member) for member in animation.mobject.get_family())
+        for mob in members:
+            if mob.updaters:
+                dynamic.update(id(member) for member in mob.get_family())
+
+        # 运动成员的家族全部是运动的，运动段可以连子对象一起画；
+        # 静止成员只画自身，它的运动子对象在自己的运动段里画
+        runs = []
+        for mob in members:
+            is_static = id(mob) not in dynamic
+            if runs and runs[-1][0] == is_static:
+                runs[-1][1].append(mob)
+            else:
+                runs.append((is_static, [mob]))
+
+        if not any(is_static for is_static, _ in runs):
+            return None
+        return [
+            (is_static, self._draw_layer(mobs) if is_static else mobs)
+            for is_static, mobs in runs
+        ]
+
+    def _draw_layer(self, mobjects):
+        """把一组静止对象画到透明图层上，只保留有内容的矩形区域"""
+        camera = self.scene.renderer.camera
+        frame = camera.pixel_array
+        layer = np.zeros_like(frame)
+        camera.pixel_array = layer
+        try:
+            camera.capture_mobjects(mobjects, include_submobjects=False)
+        finally:
+            camera.pixel_array = frame
+            # 图层用完就释放，不能留下按 id 缓存的 cairo context
+            camera.pixel_array_to_cairo_context.pop(id(layer), None)
+        self.layers_drawn += 1
+
+        alpha = layer[:, :, 3]
+        rows = np.flatnonzero(alpha.any(axis=1))
+        if len(rows) == 0:
+            return None
+        cols = np.flatnonzero(alpha.any(axis=0))
+        y0, y1, x0, x1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        pixels = layer[y0:y1, x0:x1].astype(np.uint16)
+        inverse_alpha = 255 - pixels[:, :, 3:4]
+        return (slice(y0, y1), slice(x0, x1)), pixels, inverse_alpha
+
+    @staticmethod
+    def _composite(pixel_array, layer):
+        """预乘 alpha 的 "over" 合成：结果 = 图层 + 底图 * (1 - 图层 alpha)"""
+        if layer is None:
+            return
+        region, pixels, inverse_alpha = layer
+        target = pixel_array[region]
+        target[:] = pixels + (target * inverse_alpha + 127) // 255
+
+
+def enable_layer_cache(scene):
+    """
+    给场景开启静止图层缓存
+
+    参数:
+    - scene: 场景对象（可以在 setup 中调用，这时 scene.renderer 已经可用）
+
+    返回: LayerCache 对象
+    """
+    return LayerCache(scene).install()
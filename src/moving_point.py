@@ -1,60 +1,124 @@
 # moving_point.py
 from manim import *
 import numpy as np
+from src.path_sampler import path_sampler
+from src.tex_cache import cached_math_tex
+from src.trajectory import TrackerTimeline
+
+
+def get_line_endpoints(line):
+    """
+    取向量/线段的起点和终点
+
+    参数:
+    - line: 向量或线段对象（SingleVector 或 Line/Arrow），None 时返回默认线段
+    """
+    if isinstance(line, Arrow):
+        return line.get_start(), line.get_end()
+    elif hasattr(line, 'vector_obj'):  # SingleVector 对象
+        return line.origin, line.origin + line.vector
+    elif isinstance(line, Line):
+        return line.get_start(), line.get_end()
+    else:
+        # 默认创建一条线段
+        return ORIGIN, RIGHT * 3
+
+
+def is_straight_line(line):
+    """是否是直线段（按起点终点线性插值即可）"""
+    return line is None or isinstance(line, Line) or hasattr(line, 'vector_obj')
+
+
+def get_path_geometry(line):
+    """
+    动点路径的几何数据（MovingPoint 和数值模式共用）
+
+    参数:
+    - line: 向量、线段或任意 VMobject 路径（与 MovingPoint 的 line 参数相同）
+
+    返回: (sampler, 起点, 终点)；直线段的 sampler 为 None，按起点终点线性插值
+    """
+    if isinstance(line, VMobject) and not is_straight_line(line) \
+            and len(line.points) >= line.n_points_per_cubic_curve:
+        sampler = path_sampler(line)
+        return sampler, sampler.point_at(0), sampler.point_at(1)
+    # 直线段；不是 VMobject 或没有点的对象仍然退回默认线段
+    start_point, end_point = get_line_endpoints(line)
+    return None, start_point, end_point
+
 
 class MovingPoint:
-    """在向量或线段上移动的点 - 最简实现"""
+    """在向量、线段或任意路径上移动的点 - 最简实现
+
+    直线段按起点终点线性插值；其他路径（Arc、Circle、axes.plot 的曲线等）
+    创建时用 path_sampler 预先算好弧长查找表，之后每帧只做一次二分查找和插值，
+    位置参数按弧长计算，所以匀速变化的参数就是匀速运动。
+    """
     
-    def __init__(self, line=None, color=RED, point_label='P', label_position=UP):
+    def __init__(self, line=None, color=RED, point_label='P', label_position=UP,
+                 redraw=False):
         """
         创建一个在向量/线段上移动的点
         
         参数:
-        - line: 向量或线段对象（SingleVector 或 Line/Arrow）
+        - line: 向量或线段对象（SingleVector 或 Line/Arrow），或任意 VMobject 路径
         - color: 点颜色
         - point_label: 点标签
         - label_position: 标签位置（UP, DOWN, LEFT, RIGHT）
+        - redraw: True 时每帧用 always_redraw 重建点和标签（旧模式），
+          默认 False 只创建一次，由 updater 原地移动
         """
         self.line = line
         self.color = color
         self.point_label = point_label
+        self.label_position = label_position
         
         # 位置跟踪器（0=起点，1=终点）
         self.position_tracker = ValueTracker(0)
         
-        # 计算起点和终点
-        if isinstance(line, Arrow):
-            self.start_point = line.get_start()
-            self.end_point = line.get_end()
-        elif hasattr(line, 'vector_obj'):  # SingleVector 对象
-            self.start_point = line.origin
-            self.end_point = line.origin + line.vector
-        elif isinstance(line, Line):
-            self.start_point = line.get_start()
-            self.end_point = line.get_end()
-        else:
-            # 默认创建一条线段
-            self.start_point = ORIGIN
-            self.end_point = RIGHT * 3
+        # 计算起点和终点（曲线路径同时建好弧长查找表）
+        self.sampler = None
+        self.refresh_path()
         
+        if redraw:
+            self._create_redraw_mobjects()
+        else:
+            self._create_updater_mobjects()
+    
+    def refresh_path(self):
+        """路径在创建动点之后被移动或变形时，重新计算起点、终点和弧长查找表"""
+        self.sampler, self.start_point, self.end_point = get_path_geometry(self.line)
+    
+    def _create_redraw_mobjects(self):
+        """每帧重建点和标签"""
         # 创建动态点
         self.point = always_redraw(
             lambda: Dot(
-                self.start_point + 
-                self.position_tracker.get_value() * 
-                (self.end_point - self.start_point),
-                color=color,
+                self.get_position(),
+                color=self.color,
                 radius=0.08
             )
         )
         
         # 创建点标签
         self.label = always_redraw(
-            lambda: MathTex(point_label).scale(0.8).next_to(
-                self.point.get_center(), label_position, buff=0.1
-            ).set_color(color)
+            lambda: cached_math_tex(
+                self.point_label, scale=0.8, color=self.color
+            ).next_to(self.point.get_center(), self.label_position, buff=0.1)
         )
     
+    def _create_updater_mobjects(self):
+        """只创建一次点和标签，每帧原地移动"""
+        self.point = Dot(self.get_position(), color=self.color, radius=0.08)
+        self.point.add_updater(lambda m: m.move_to(self.get_position()))
+        
+        # 标签只编译一次 LaTeX，之后只做 next_to
+        self.label = cached_math_tex(self.point_label, scale=0.8, color=self.color)
+        self.label.add_updater(
+            lambda m: m.next_to(self.get_position(), self.label_position, buff=0.1)
+        )
+        self.label.update()
+    
     def show(self, scene):
         """显示动点"""
         scene.add(self.point, self.label)
@@ -90,6 +154,172 @@ class MovingPoint:
         
         for pos, time in zip(positions, run_times):
             self.move_to(pos, scene, time)
+    
+    def get_position(self):
+        """根据 position_tracker 计算点的当前位置"""
+        if self.sampler is not None:
+            return self.sampler.point_at(self.position_tracker.get_value())
+        return (
+            self.start_point +
+            self.position_tracker.get_value() *
+            (self.end_point - self.start_point)
+        )
+    
     def get_center(self):
         """获取点的中心位置（方便外部访问）"""
-        return self.point.get_center()
\ No newline at end of file
+        return self.point.get_center()
+    
+    @staticmethod
+    def evaluate_trajectory(line, positions, run_times=None, initial_position=0,
+                            frame_rate=None):
+        """
+        数值模式：不创建点和标签，算出 move_along 每一帧的位置
+        
+        参数:
+        - line: 路径（与构造函数的 line 参数相同，曲线同样按弧长取位置）
+        - positions: 位置列表（与 move_along 相同）
+        - run_times: 每个位置的时间列表（默认每段 2 秒）
+        - initial_position: position_tracker 的初始值
+        - frame_rate: 帧率（默认 manim 配置中的帧率）
+        
+        返回: 字典 {'time': (N,), 'position': (N,), 'point': (N, 3)}
+        """
+        if run_times is None:
+            run_times = [2] * len(positions)
+        
+        timeline = TrackerTimeline(initial_position)
+        for position, run_time in zip(positions, run_times):
+            timeline.animate(position, run_time)
+        data = timeline.sample(frame_rate)
+        
+        sampler, start_point, end_point = get_path_geometry(line)
+        position = data['value']
+        if sampler is not None:
+            point = sampler.points_at(position)
+        else:
+            start_point = np.asarray(start_point, dtype=float)
+            end_point = np.asarray(end_point, dtype=float)
+            point = start_point + position[:, np.newaxis] * (end_point - start_point)
+        return {
+            'time': data['time'],
+            'position': position,
+            'point': point,
+        }
+
+
+class MovingPointGroup:
+    """在多条向量/线段上同时移动的一组点 - 所有点共用一套数组和一个 mobject
+
+    所有起点、终点和位置参数都保存在连续的 NumPy 数组中，
+    每帧用一次向量化运算算出全部位置，并更新同一个 VMobject 的点数据。
+    """
+    
+    def __init__(self, lines=None, color=RED, radius=0.08, positions=0,
+                 start_points=None, end_points=None):
+        """
+        创建一组动点
+        
+        参数:
+        - lines: 向量或线段对象列表（SingleVector 或 Line/Arrow）
+        - color: 点颜色
+        - radius: 点半径
+        - positions: 初始位置（0=起点，1=终点），可以是一个数或每个点一个值
+        - start_points, end_points: 不传 lines 时直接给出 (N, 3) 的起点和终点数组
+        """
+        if lines is not None:
+            endpoints = [get_line_endpoints(line) for line in lines]
+            start_points = [start for start, _ in endpoints]
+            end_points = [end for _, end in endpoints]
+        
+        self.start_points = np.array(start_points, dtype=float).reshape(-1, 3)
+        self.end_points = np.array(end_points, dtype=float).reshape(-1, 3)
+        if self.start_points.shape != self.end_points.shape:
+            raise ValueError("start_points and end_points must have the same shape")
+        self.directions = self.end_points - self.start_points
+        self.color = color
+        
+        # 动画从 from_positions 插值到 to_positions，进度由一个跟踪器控制
+        n = len(self.start_points)
+        self.from_positions = np.broadcast_to(
+            np.asarray(positions, dtype=float), (n,)
+        ).copy()
+        self.to_positions = self.from_positions.copy()
+        self.progress_tracker = ValueTracker(1)
+        
+        # 单个点的轮廓，所有点共用
+        self._dot_points = Dot(ORIGIN, radius=radius).points.copy()
+        
+        self.dots = VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+        self.dots.add_updater(self._update_dots)
+        self._update_dots(self.dots)
+    
+    def __len__(self):
+        return len(self.start_points)
+    
+    def _update_dots(self, dots):
+        """一次性计算所有点的轮廓"""
+        centers = self.get_centers()
+        dots.points = (
+            self._dot_points[np.newaxis, :, :] + centers[:, np.newaxis, :]
+        ).reshape(-1, 3)
+    
+    def show(self, scene):
+        """显示所有动点"""
+        scene.add(self.dots)
+    
+    def get_positions(self):
+        """当前所有点的位置参数（0=起点，1=终点）"""
+        progress = self.progress_tracker.get_value()
+        return self.from_positions + progress * (self.to_positions - self.from_positions)
+    
+    def get_centers(self):
+        """当前所有点的坐标，形状 (N, 3)"""
+        return self.start_points + self.get_positions()[:, np.newaxis] * self.directions
+    
+    def move_to(self, positions, scene=None, run_time=2, indices=None, **kwargs):
+        """
+        移动到指定位置（0=起点，1=终点）
+        
+        参数:
+        - positions: 位置值，一个数表示所有点（或 indices 中的点）移动到同一位置，
+          也可以是每个点一个值的数组
+        - scene: 场景对象（用于动画）
+        - run_time: 动画时间
+        - indices: 只移动这些点（默认全部）
+        - kwargs: 传给 scene.play 的其它参数（如 rate_func）
+        """
+        current = self.get_positions()
+        target = current.copy()
+        if indices is None:
+            target[:] = positions
+        else:
+            target[indices] = positions
+        
+        self.from_positions = current
+        self.to_positions = target
+        if scene:
+            self.progress_tracker.set_value(0)
+            scene.play(
+                self.progress_tracker.animate.set_value(1),
+                run_time=run_time,
+                **kwargs
+            )
+        else:
+            self.progress_tracker.set_value(1)
+            self._update_dots(self.dots)
+    
+    def move_along(self, positions, scene, run_times=None, indices=None):
+        """
+        沿路径移动一系列位置
+        
+        参数:
+        - positions: 位置列表，每一项是一个数或每个点一个值的数组
+        - scene: 场景对象
+        - run_times: 每个位置的时间列表
+        - indices: 只移动这些点（默认全部）
+        """
+        if run_times is None:
+            run_times = [2] * len(positions)
+        
+        for pos, time in zip(positions, run_times):
+            self.move_to(pos, scene, time, indices=indices)
@@ -1,9 +1,24 @@
 # single_vector.py
 from manim import *
+import inspect
 import numpy as np
+from src.tex_cache import cached_math_tex
+
+# 直线段对应的三次贝塞尔控制点比例
+_SEGMENT_THIRDS = np.array([0, 1 / 3, 2 / 3, 1])[:, np.newaxis]
 
 class SingleVector:
-    """简化的向量类 - 三个标签全部用 MathTex"""
+    """简化的向量类 - 三个标签全部用 MathTex
+
+    几何数据（起点和向量）保存在一个 (2, 3) 的浮点数组里，
+    所有图形放在一个 VGroup 中，移动时只做一次整体平移。
+    """
+    
+    __slots__ = (
+        '_geometry', 'color', 'start_label', 'mid_label', 'end_label',
+        'vector_obj', 'start_label_obj', 'mid_label_obj', 'end_label_obj',
+        'start_dot', 'mobject',
+    )
     
     def __init__(self, vector=[3, 0, 0], color=BLUE, start_label='A', 
                  mid_label=r'\vec{a}', end_label='B', origin=ORIGIN):
@@ -18,25 +33,17 @@ class SingleVector:
         - end_label: 终点标签（默认'B'）
         - origin: 原点位置
         """
-        # 转换为numpy数组
-        if isinstance(vector, list):
-            vector = np.array(vector)
-        if isinstance(origin, list):
-            origin = np.array(origin)
+        # 第 0 行是起点，第 1 行是向量（复制成浮点数，不会引用全局的 ORIGIN）
+        self._geometry = np.empty((2, 3))
+        self._geometry[0] = origin
+        self._geometry[1] = vector
         
         # 存储属性
-        self.vector = vector
-        self.origin = origin
         self.color = color
         self.start_label = start_label
         self.mid_label = mid_label
         self.end_label = end_label
         
-        # 计算绝对坐标
-        self.absolute_start = origin
-        self.absolute_end = origin + vector
-        self.absolute_mid = origin + vector / 2
-        
         # 创建向量
         self.vector_obj = Arrow(
             start=self.absolute_start,
@@ -58,9 +65,63 @@ class SingleVector:
         
         # 创建起点标记点
         self.start_dot = Dot(self.absolute_start, color=color, radius=0.05)
+        
+        # 所有图形放在一个组里，整体移动
+        self.mobject = VGroup(
+            self.start_dot,
+            self.vector_obj,
+            self.start_label_obj,
+            self.mid_label_obj,
+            self.end_label_obj
+        )
     
-    def show(self, scene, create_time=1, write_time=0.5):
-        """在场景中显示向量"""
+    @classmethod
+    def get_tex_items(cls, *args, **kwargs):
+        """
+        用与构造函数相同的参数，列出会创建的三个标签（不创建对象，供 precompile_tex 使用）
+
+        返回: [起点标签, 中间标签, 终点标签]（包括没有传入、使用默认值的标签）
+        """
+        arguments = inspect.signature(cls.__init__).bind(None, *args, **kwargs)
+        arguments.apply_defaults()
+        return [arguments.arguments[name] for name in ('start_label', 'mid_label', 'end_label')]
+    
+    @property
+    def origin(self):
+        """起点（副本）"""
+        return self._geometry[0].copy()
+    
+    @property
+    def vector(self):
+        """向量（副本）"""
+        return self._geometry[1].copy()
+    
+    @property
+    def absolute_start(self):
+        return self._geometry[0].copy()
+    
+    @property
+    def absolute_end(self):
+        return self._geometry[0] + self._geometry[1]
+    
+    @property
+    def absolute_mid(self):
+        return self._geometry[0] + self._geometry[1] / 2
+    
+    def show(self, scene, create_time=1, write_time=0.5, combine=False):
+        """
+        在场景中显示向量
+        
+        参数:
+        - scene: 场景对象
+        - create_time: 起点和箭头的动画时间
+        - write_time: 标签的动画时间
+        - combine: True 时合成一个动画只调用一次 scene.play（只生成一个片段文件）
+        """
+        if combine:
+            scene.play(self.get_show_animation(create_time, write_time))
+            return
+        
         # 显示起点
         scene.play(FadeIn(self.start_dot), run_time=create_time/2)
         scene.play(Write(self.start_label_obj), run_time=write_time/2)
@@ -77,25 +138,232 @@ class SingleVector:
         
         scene.wait(0.5)
     
+    def get_show_animation(self, create_time=1, write_time=0.5):
+        """返回与 show 时间完全相同的组合动画（可以和其它动画一起 play）"""
+        return Succession(
+            FadeIn(self.start_dot, run_time=create_time/2),
+            Write(self.start_label_obj, run_time=write_time/2),
+            GrowArrow(self.vector_obj, run_time=create_time),
+            AnimationGroup(
+                Write(self.mid_label_obj),
+                Write(self.end_label_obj),
+                run_time=write_time
+            ),
+            Wait(run_time=0.5)
+        )
+    
     def shift(self, direction):
         """移动整个向量"""
-        # 移动所有图形对象
-        self.vector_obj.shift(direction)
-        self.start_dot.shift(direction)
-        self.start_label_obj.shift(direction)
-        self.mid_label_obj.shift(direction)
-        self.end_label_obj.shift(direction)
-        
-        # 更新坐标
-        dir_array = np.array(direction)
-        self.origin += dir_array
-        self.absolute_start += dir_array
-        self.absolute_end += dir_array
-        self.absolute_mid += dir_array
-        
+        direction = np.asarray(direction, dtype=float)
+        self.mobject.shift(direction)
+        self._geometry[0] += direction
         return self
     
     def move_to(self, new_origin):
         """移动到新原点"""
-        shift_amount = np.array(new_origin) - self.origin
-        return self.shift(shift_amount)
\ No newline at end of file
+        return self.shift(np.asarray(new_origin, dtype=float) - self._geometry[0])
+
+
+class VectorSet(VGroup):
+    """一组向量 - 所有箭头一次性向量化生成
+
+    起点和向量保存在 (N, 3) 数组中，同一种颜色的所有箭杆合成一个 VMobject，
+    所有箭头尖合成另一个 VMobject（每个箭头是其中一段子路径），
+    几千个箭头也只有几个 mobject。相同的标签只编译一次 LaTeX（cached_math_tex）。
+
+    origins / vectors 每次读取时都由箭杆起点和箭头尖顶点重新得到，
+    所以 shift、rotate、.animate 等任何变换之后都与画面一致，
+    scale_vectors、set_vectors 也会在变换后的位置上继续修改。
+    """
+    
+    def __init__(self, origins, vectors, colors=BLUE, labels=None, stroke_width=4,
+                 max_tip_length=0.35, tip_ratio=0.25, label_scale=0.6, label_buff=0.25,
+                 **kwargs):
+        """
+        参数:
+        - origins: 起点数组，形状 (N, 3)（也可以是一个点，所有向量共用）
+        - vectors: 向量数组，形状 (N, 3)
+        - colors: 一种颜色，或每个向量一种颜色
+        - labels: 可选，一个字符串（所有向量相同）或每个向量一个字符串（None 表示不加）
+        - stroke_width: 箭杆宽度
+        - max_tip_length: 箭头尖的最大长度
+        - tip_ratio: 箭头尖长度占向量长度的比例（取两者中较小的）
+        - label_scale: 标签缩放
+        - label_buff: 标签中心到终点的距离（沿向量方向）
+        """
+        super().__init__(**kwargs)
+        self._vectors = np.array(vectors, dtype=float).reshape(-1, 3)
+        self._origins = np.broadcast_to(
+            np.array(origins, dtype=float).reshape(-1, 3), self._vectors.shape
+        ).copy()
+        self.stroke_width_value = stroke_width
+        self.max_tip_length = max_tip_length
+        self.tip_ratio = tip_ratio
+        self.label_buff = label_buff
+        
+        self.shafts = VGroup()
+        self.tips = VGroup()
+        self.labels = VGroup()
+        self.add(self.shafts, self.tips, self.labels)
+        
+        self.vector_colors = self._expand_colors(colors)
+        self._build_color_groups()
+        self._build_labels(labels, label_scale)
+    
+    @property
+    def origins(self):
+        """所有起点，形状 (N, 3)（副本）"""
+        self._sync_from_points()
+        return self._origins.copy()
+    
+    @property
+    def vectors(self):
+        """所有向量，形状 (N, 3)（副本）"""
+        self._sync_from_points()
+        return self._vectors.copy()
+    
+    def get_num_vectors(self):
+        return len(self._vectors)
+    
+    def _sync_from_points(self):
+        """由当前的点数据更新起点和向量数组（Create 等动画中点数不完整时跳过）"""
+        for indices, shaft, tip in zip(self._color_groups, self.shafts, self.tips):
+            if len(shaft.points) != 4 * len(indices) or len(tip.points) != 12 * len(indices):
+                continue
+            # 箭杆的第一个点是起点，箭头尖的第一个点是终点
+            self._origins[indices] = shaft.points[::4]
+            self._vectors[indices] = tip.points[::12] - shaft.points[::4]
+    
+    def _expand_colors(self, colors):
+        if isinstance(colors, (list, tuple)) and len(colors) == len(self._vectors) \
+                and not isinstance(colors[0], (int, float)):
+            return [ManimColor(color) for color in colors]
+        return [ManimColor(colors)] * len(self._vectors)
+    
+    def _build_color_groups(self):
+        """每种颜色一个箭杆 VMobject 和一个箭头尖 VMobject"""
+        groups = {}
+        for index, color in enumerate(self.vector_colors):
+            groups.setdefault(color.to_hex(with_alpha=True), []).append(index)
+        
+        self._color_groups = []
+        shafts, tips = [], []
+        for indices in groups.values():
+            color = self.vector_colors[indices[0]]
+            shafts.append(VMobject(stroke_color=color, stroke_width=self.stroke_width_value))
+            tips.append(VMobject(fill_color=color, fill_opacity=1, stroke_width=0))
+            self._color_groups.append(np.array(indices))
+        
+        self.shafts.remove(*self.shafts.submobjects)
+        self.tips.remove(*self.tips.submobjects)
+        self.shafts.add(*shafts)
+        self.tips.add(*tips)
+        self._update_geometry()
+    
+    def _compute_geometry(self, indices):
+        """
+        向量化计算一组箭头的点
+        
+        返回: (箭杆点 (n*4, 3), 箭头尖点 (n*12, 3))
+        """
+        origins = self._origins[indices]
+        vectors = self._vectors[indices]
+        lengths = np.linalg.norm(vectors, axis=1)
+        units = np.divide(
+            vectors, lengths[:, np.newaxis],
+            out=np.zeros_like(vectors), where=lengths[:, np.newaxis] > 0
+        )
+        tip_lengths = np.minimum(self.max_tip_length, self.tip_ratio * lengths)[:, np.newaxis]
+        ends = origins + vectors
+        bases = ends - units * tip_lengths
+        
+        # 箭杆：起点到箭头尖底部的直线
+        shafts = origins[:, np.newaxis] + _SEGMENT_THIRDS[np.newaxis] * (bases - origins)[:, np.newaxis]
+        
+        # 箭头尖：等边三角形，高为 tip_length，底边半宽为 tip_length / sqrt(3)
+        normals = np.stack([-units[:, 1], units[:, 0], np.zeros(len(units))], axis=1)
+        half_widths = normals * tip_lengths / np.sqrt(3)
+        corners = np.stack([ends, bases + half_widths, bases - half_widths, ends], axis=1)
+        starts, stops = corners[:, :-1], corners[:, 1:]
+        tips = starts[:, :, np.newaxis] + _SEGMENT_THIRDS[np.newaxis, np.newaxis] * (stops - starts)[:, :, np.newaxis]
+        return shafts.reshape(-1, 3), tips.reshape(-1, 3)
+    
+    def _update_geometry(self):
+        for indices, shaft, tip in zip(self._color_groups, self.shafts, self.tips):
+            shaft.points, tip.points = self._compute_geometry(indices)
+    
+    def _get_label_anchors(self):
+        lengths = np.linalg.norm(self._vectors, axis=1)[:, np.newaxis]
+        units = np.divide(self._vectors, lengths, out=np.zeros_like(self._vectors), where=lengths > 0)
+        return self._origins + self._vectors + units * self.label_buff
+    
+    def _build_labels(self, labels, label_scale):
+        """相同的标签字符串共用一次 LaTeX 编译结果"""
+        self._label_indices = []
+        if labels is None:
+            return
+        if isinstance(labels, str):
+            labels = [labels] * len(self._vectors)
+        anchors = self._get_label_anchors()
+        for index, label in enumerate(labels):
+            if label is None:
+                continue
+            mob = cached_math_tex(label, scale=label_scale, color=self.vector_colors[index])
+            mob.move_to(anchors[index])
+            self.labels.add(mob)
+            self._label_indices.append(index)
+    
+    def _move_labels(self, old_anchors):
+        """几何变化后按锚点的位移移动标签"""
+        if not self._label_indices:
+            return
+        offsets = self._get_label_anchors() - old_anchors
+        for mob, index in zip(self.labels, self._label_indices):
+            mob.shift(offsets[index])
+    
+    def get_ends(self):
+        """所有终点，形状 (N, 3)"""
+        self._sync_from_points()
+        return self._origins + self._vectors
+    
+    def scale_vectors(self, factor):
+        """
+        缩放所有向量的长度（起点不动）
+        
+        参数:
+        - factor: 一个数，或每个向量一个数（形状 (N,)）
+        """
+        self._sync_from_points()
+        old_anchors = self._get_label_anchors()
+        factor = np.asarray(factor, dtype=float)
+        self._vectors *= factor[:, np.newaxis] if factor.ndim else factor
+        self._update_geometry()
+        self._move_labels(old_anchors)
+        return self
+    
+    def set_vectors(self, vectors=None, origins=None):
+        """直接替换向量和/或起点数组，一次性重新计算所有箭头"""
+        self._sync_from_points()
+        old_anchors = self._get_label_anchors()
+        if vectors is not None:
+            self._vectors[:] = np.asarray(vectors, dtype=float).reshape(-1, 3)
+        if origins is not None:
+            self._origins[:] = np.asarray(origins, dtype=float).reshape(-1, 3)
+        self._update_geometry()
+        self._move_labels(old_anchors)
+        return self
+    
+    def set_vector_colors(self, colors):
+        """
+        设置颜色
+        
+        参数:
+        - colors: 一种颜色，或每个向量一种颜色
+        """
+        self._sync_from_points()
+        self.vector_colors = self._expand_colors(colors)
+        self._build_color_groups()
+        for mob, index in zip(self.labels, self._label_indices):
+            mob.set_color(self.vector_colors[index])
+        return self
+
@@ -0,0 +1,141 @@
+# parallel_render.py
+from manim import *
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import os
+import time
+
+from src.render_options import QUALITIES
+from src.scene_runner import render_scene, get_output_file
+
+
+def get_play_durations(module_name, scene_name, config_overrides=None):
+    """
+    在跳过模式下运行一遍场景，返回每次 play/wait 的时长
+
+    跳过模式不会光栅化任何帧，只更新对象状态，所以很快。
+    """
+    durations = []
+
+    def record_durations(scene):
+        renderer = scene.renderer
+        play = renderer.play
+
+        def timed_play(*args, **kwargs):
+            start = renderer.time
+            play(*args, **kwargs)
+            durations.append(renderer.time - start)
+
+        renderer.play = timed_play
+
+    overrides = dict(config_overrides or {})
+    overrides.update({'save_last_frame': True, 'write_to_movie': False})
+    render_scene(module_name, scene_name, overrides, before_render=record_durations)
+    return durations
+
+
+def split_plays(durations, workers):
+    """
+    把 play 序号分成连续的区间 [(first, last), ...]
+
+    每个区间的总时长不超过 max(最长的一次 play, 总时长 / (2 * workers))，
+    这样区间数量够多，进程池可以把负载分匀。
+    """
+    if not durations:
+        return []
+    target = max(max(durations), sum(durations) / (2 * workers))
+    ranges = []
+    first, total = 0, 0.0
+    for index, duration in enumerate(durations):
+        if index > first and total + duration > target:
+            ranges.append((first, index - 1))
+            first, total = index, 0.0
+        total += duration
+    ranges.append((first, len(durations) - 1))
+    return ranges
+
+
+def _render_range(module_name, scene_name, first, last, config_overrides):
+    """
+    子进程：只渲染第 first 到 last 次 play
+
+    之前的 play 在跳过模式下执行，场景状态与完整渲染时完全一致，
+    渲染出的片段按 manim 的哈希写入共享的 partial_movie_files 目录。
+    """
+    overrides = dict(config_overrides)
+    overrides.update({
+        'from_animation_number': first,
+        'upto_animation_number': last,
+        'output_file': f'{scene_name}_plays_{first:04d}_{last:04d}',
+    })
+    start = time.perf_counter()
+    scene = render_scene(module_name, scene_name, overrides)
+    # 这个区间自己拼接出的视频用不到，只保留片段
+    output = get_output_file(scene)
+    if output and os.path.exists(output):
+        os.remove(output)
+    return first, last, time.perf_counter() - start
+
+
+def render_parallel(module_name, scene_name, workers=None, quality='low', config_overrides=None):
+    """
+    多进程并行渲染一个场景
+
+    1. 跳过模式下运行一遍，得到每次 play 的时长；
+    2. 把 play 分成若干连续区间，在进程池中分别渲染（from/upto_animation_number）；
+    3. 最后在当前进程正常渲染一遍：每次 play 都命中片段缓存，只需拼接。
+
+    参数:
+    - module_name: 场景文件的模块名（如 'vectorclass'）
+    - scene_name: 场景类名（如 'FlexibleVectorDiagram'）
+    - workers: 进程数（默认 CPU 核数）
+    - quality: 'low' / 'medium' / 'high' / 'production' / 'fourk'
+    - config_overrides: 其他 manim 配置
+
+    返回: 最终视频文件路径
+    """
+    overrides = {'quality': QUALITIES.get(quality, quality)}
+    overrides.update(config_overrides or {})
+    # 依赖片段缓存拼接，不能关闭缓存
+    overrides['disable_caching'] = False
+    workers = workers or os.cpu_count() or 1
+
+    durations = get_play_durations(module_name, scene_name, overrides)
+    ranges = split_plays(durations, workers)
+    logger.info(
+        "%s: %d plays, %.1fs of animation, %d ranges on %d workers",
+        scene_name, len(durations), sum(durations), len(ranges), workers
+    )
+
+    # 时长最长的区间先开始
+    def range_duration(item):
+        return sum(durations[item[0]:item[1] + 1])
+
+    with ProcessPoolExecutor(max_workers=min(workers, max(len(ranges), 1))) as executor:
+        futures = [
+            executor.submit(_render_range, module_name, scene_name, first, last, overrides)
+            for first, last in sorted(ranges, key=range_duration, reverse=True)
+        ]
+        for future in as_completed(futures):
+            first, last, elapsed = future.result()
+            logger.info("plays %d-%d rendered in %.2fs", first, last, elapsed)
+
+    scene = render_scene(module_name, scene_name, overrides)
+    return get_output_file(scene)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render one scene with a process pool.')
+    parser.add_argument('module', help="scene module, e.g. 'vectorclass'")
+    parser.add_argument('scene', help="scene class, e.g. 'FlexibleVectorDiagram'")
+    parser.add_argument('-w', '--workers', type=int, default=None)
+    parser.add_argument('-q', '--quality', default='low', choices=list(QUALITIES))
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    output = render_parallel(args.module, args.scene, args.workers, args.quality)
+    print(f'{output} ({time.perf_counter() - start:.2f}s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+# path_sampler.py
+from manim import *
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class PathSampler(ABC):
+    """按比例（0=起点，1=终点）快速取路径上的点
+
+    与 VMobject.point_from_proportion 的含义相同，但不会在每次查询时
+    重新计算整条贝塞尔曲线的弧长。
+    """
+
+    def point_at(self, proportion):
+        """取单个比例位置上的点"""
+        return self.points_at(np.array([proportion], dtype=float))[0]
+
+    @abstractmethod
+    def points_at(self, proportions):
+        """
+        一次取多个比例位置上的点
+
+        参数:
+        - proportions: 比例数组，形状 (N,)
+
+        返回: 形状 (N, 3) 的点数组
+        """
+
+
+class CircleSampler(PathSampler):
+    """圆周 - 直接用解析式计算，每次查询 O(1)"""
+
+    def __init__(self, circle):
+        """
+        参数:
+        - circle: Circle 对象（要求没有被拉伸成椭圆）
+        """
+        points = circle.points
+        self.center = circle.get_center()
+        offset = points[0] - self.center
+        self.radius = np.linalg.norm(offset)
+        self.start_angle = np.arctan2(offset[1], offset[0])
+
+        # 按第一段曲线的切线判断方向（被 flip 过的圆是顺时针）
+        tangent = points[1] - points[0]
+        self.direction = 1 if np.cross(offset, tangent)[2] >= 0 else -1
+
+    def points_at(self, proportions):
+        angles = self.start_angle + self.direction * TAU * np.asarray(proportions, dtype=float)
+        result = np.zeros((len(angles), 3))
+        result[:, 0] = np.cos(angles)
+        result[:, 1] = np.sin(angles)
+        return self.center + self.radius * result
+
+
+class ArcLengthSampler(PathSampler):
+    """任意路径 - 预先计算一次弧长查找表，每次查询二分查找 O(log n)"""
+
+    def __init__(self, path, samples_per_curve=16):
+        """
+        参数:
+        - path: 任意 VMobject 路径（Arc、axes.plot 的曲线等）
+        - samples_per_curve: 每段贝塞尔曲线上的采样数，越大越精确
+        """
+        nppcc = path.n_points_per_cubic_curve
+        curves = path.points[:len(path.points) - len(path.points) % nppcc]
+        curves = curves.reshape(-1, nppcc, 3)
+        if len(curves) == 0:
+            raise ValueError("ArcLengthSampler needs a path with at least one curve")
+
+        # 在每段曲线上均匀取 t，一次性算出所有采样点
+        t = np.linspace(0, 1, samples_per_curve + 1)
+        basis = np.stack([
+            (1 - t) ** 3,
+            3 * (1 - t) ** 2 * t,
+            3 * (1 - t) * t ** 2,
+            t ** 3,
+        ], axis=1)
+        samples = np.einsum('tk,ckd->ctd', basis, curves)
+        self.samples = samples.reshape(-1, 3)
+
+        # 相邻采样点的距离；曲线之间的跳跃（子路径断开）不计入弧长
+        lengths = np.linalg.norm(np.diff(self.samples, axis=0), axis=1)
+        lengths[samples_per_curve::samples_per_curve + 1] = 0
+        self.segment_lengths = lengths
+        self.cumulative_lengths = np.concatenate([[0], np.cumsum(lengths)])
+        self.length = self.cumulative_lengths[-1]
+
+    def points_at(self, proportions):
+        proportions = np.clip(np.asarray(proportions, dtype=float), 0, 1)
+        distances = proportions * self.length
+
+        index = np.searchsorted(self.cumulative_lengths, distances, side='right') - 1
+        index = np.clip(index, 0, len(self.segment_lengths) - 1)
+
+        segment_lengths = self.segment_lengths[index]
+        safe_lengths = np.where(segment_lengths > 0, segment_lengths, 1)
+        fraction = np.where(
+            segment_lengths > 0,
+            (distances - self.cumulative_lengths[index]) / safe_lengths,
+            0,
+        )[:, np.newaxis]
+
+        start = self.samples[index]
+        end = self.samples[index + 1]
+        return start + fraction * (end - start)
+
+
+def path_sampler(path, samples_per_curve=16):
+    """
+    为路径选择合适的采样器
+
+    参数:
+    - path: VMobject 路径
+    - samples_per_curve: 一般路径的弧长表精度
+
+    返回: 圆用 CircleSampler（解析式），其余用 ArcLengthSampler（查找表）
+    """
+    if isinstance(path, Circle) and np.isclose(path.width, path.height):
+        return CircleSampler(path)
+    return ArcLengthSampler(path, samples_per_curve)
@@ -0,0 +1,46 @@
+# play_merge.py
+from manim import *
+from contextlib import contextmanager
+
+
+@contextmanager
+def merged_plays(scene):
+    """
+    把一段代码中连续的 scene.play / scene.wait 合并成一次 play
+
+    每次 play 都会单独生成一个片段文件并重新启动一次编码器，
+    很多短动画连在一起时这部分开销比渲染本身还大。
+    在 with 块中调用的 play 和 wait 会先排队，退出时按原来的
+    顺序和时间组成一个 Succession 一次性播放。
+
+    注意：with 块中直接调用的 scene.add / scene.remove 会立即生效，
+    不会等到排队的动画播放到那里。
+
+    用法:
+        with merged_plays(self):
+            vector1.show(self)
+            vector2.show(self)
+    """
+    queue = []
+
+    def queued_play(*args, **kwargs):
+        animations = scene.compile_animations(*args, **kwargs)
+        if len(animations) == 1:
+            queue.append(animations[0])
+        else:
+            queue.append(AnimationGroup(*animations))
+
+    def queued_wait(duration=DEFAULT_WAIT_TIME, **kwargs):
+        queue.append(Wait(run_time=duration, **kwargs))
+
+    scene.play = queued_play
+    scene.wait = queued_wait
+    try:
+        yield scene
+    finally:
+        # 删除实例属性，恢复类上的 play / wait
+        del scene.play
+        del scene.wait
+
+    if queue:
+        scene.play(Succession(*queue))
@@ -0,0 +1,22 @@
+# render_options.py
+# 各个渲染命令共用的画质表和清单写入
+# 注意：这个模块不能 import manim，scene_index 和 render_scheduler 的主进程都会导入它
+import json
+import os
+
+# 命令行画质名 -> manim 的 quality 配置
+QUALITIES = {
+    'low': 'low_quality',
+    'medium': 'medium_quality',
+    'high': 'high_quality',
+    'production': 'production_quality',
+    'fourk': 'fourk_quality',
+}
+
+
+def save_manifest(manifest, path):
+    """先写临时文件再替换，中途中断也不会留下损坏的清单"""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
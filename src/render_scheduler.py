@@ -0,0 +1,213 @@
+# render_scheduler.py
+# 主进程不导入 manim：场景列表来自 scene_index，manim 只在工作进程中导入一次
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from importlib import metadata
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+import traceback
+
+from src.render_options import QUALITIES, save_manifest
+from src.scene_index import REPO_ROOT, SceneIndex
+
+MANIFEST_VERSION = 1
+
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _manim_version():
+    try:
+        return metadata.version('manim')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def source_hash(index, module_name, quality, file_digests=None):
+    """
+    场景的输入哈希：模块及其所有本仓库依赖的文件内容、画质和 manim 版本
+
+    参数:
+    - index: 已加载的 SceneIndex
+    - module_name: 场景所在模块
+    - quality: 画质名
+    - file_digests: 可选的 {文件: 内容哈希} 字典，多个场景共用，每个文件只读一次
+    """
+    file_digests = {} if file_digests is None else file_digests
+    parts = [['quality', quality], ['manim', _manim_version()]]
+    for name in index.get_dependencies(module_name):
+        relative = index.files[name]
+        if relative not in file_digests:
+            file_digests[relative] = _file_digest(os.path.join(index.root, relative))
+        parts.append([relative, file_digests[relative]])
+    text = json.dumps(parts, separators=(',', ':'))
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def load_manifest(path):
+    if os.path.exists(path):
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    return {'version': MANIFEST_VERSION, 'scenes': {}}
+
+
+def _init_worker():
+    """工作进程启动时导入一次 manim，之后的场景都复用"""
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    import src.scene_runner  # noqa: F401
+
+
+def _render_job(module_name, scene_name, config_overrides):
+    """子进程：渲染一个场景，失败时返回错误信息而不是抛出异常"""
+    from src.scene_runner import render_scene, get_output_file
+
+    start = time.perf_counter()
+    try:
+        scene = render_scene(module_name, scene_name, config_overrides)
+    except Exception:
+        return {'error': traceback.format_exc(), 'render_time': time.perf_counter() - start}
+    return {'output': get_output_file(scene), 'render_time': time.perf_counter() - start}
+
+
+def plan_jobs(scenes, manifest, hashes, force=False):
+    """
+    决定要渲染哪些场景以及顺序
+
+    输入哈希没变、上次成功并且输出文件还在的场景跳过；
+    其余按历史耗时从长到短排序（没有历史的排在最前），
+    让最慢的场景最先开始，减少最后只剩一个进程在跑的时间。
+
+    返回: (要渲染的场景列表, 跳过的场景列表)
+    """
+    history = manifest['scenes']
+    jobs, skipped = [], []
+    for scene in scenes:
+        record = history.get(scene['id'], {})
+        unchanged = (
+            record.get('hash') == hashes[scene['id']]
+            and 'error' not in record
+            and record.get('output')
+            and os.path.exists(record['output'])
+        )
+        if unchanged and not force:
+            skipped.append(scene)
+        else:
+            jobs.append(scene)
+    jobs.sort(key=lambda scene: -history.get(scene['id'], {}).get('render_time', math.inf))
+    return jobs, skipped
+
+
+def run_schedule(patterns=None, workers=None, quality='low', manifest_path='render_manifest.json',
+                 config_overrides=None, force=False, dry_run=False):
+    """
+    渲染仓库中（选中的）所有场景
+
+    参数:
+    - patterns: 场景模式（见 SceneIndex.select），为空时全部
+    - workers: 进程数（默认 CPU 核数）
+    - quality: 画质名（见 QUALITIES）
+    - manifest_path: 清单文件，记录每个场景的输入哈希、输出、耗时和错误
+    - config_overrides: 其他 manim 配置
+    - force: 忽略哈希，全部重新渲染
+    - dry_run: 只打印计划，不渲染
+
+    返回: 清单字典
+    """
+    index = SceneIndex().load()
+    scenes = index.select(patterns)
+    file_digests = {}
+    hashes = {
+        scene['id']: source_hash(index, scene['module'], quality, file_digests)
+        for scene in scenes
+    }
+
+    manifest = load_manifest(manifest_path)
+    jobs, skipped = plan_jobs(scenes, manifest, hashes, force)
+    for scene in skipped:
+        print(f"skip   {scene['id']} (unchanged)")
+    if dry_run or not jobs:
+        for scene in jobs:
+            estimate = manifest['scenes'].get(scene['id'], {}).get('render_time')
+            print(f"render {scene['id']} ({f'{estimate:.1f} s' if estimate else 'no history'})")
+        return manifest
+
+    overrides = {'quality': QUALITIES[quality]}
+    overrides.update(config_overrides or {})
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {
+            executor.submit(_render_job, scene['module'], scene['name'], overrides): scene
+            for scene in jobs
+        }
+        for future in as_completed(futures):
+            scene = futures[future]
+            try:
+                result = future.result()
+            except BrokenProcessPool as error:
+                # 工作进程崩溃（如内存不足被杀死）时，剩下的任务都会失败
+                result = {'error': f'worker process died: {error}'}
+            record = {
+                'hash': hashes[scene['id']],
+                'module': scene['module'],
+                'scene': scene['name'],
+                'quality': quality,
+                'finished_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            }
+            record.update(result)
+            if 'error' in result:
+                # 失败的耗时不能代表正常耗时，保留上一次成功的记录用于排序
+                previous = manifest['scenes'].get(scene['id'], {})
+                if 'render_time' in previous and 'error' not in previous:
+                    record['render_time'] = previous['render_time']
+                print(f"failed {scene['id']}: {result['error'].strip().splitlines()[-1]}")
+            else:
+                print(f"done   {scene['id']} in {result['render_time']:.1f} s -> {result['output']}")
+            manifest['scenes'][scene['id']] = record
+            save_manifest(manifest, manifest_path)
+
+    manifest['last_run'] = {
+        'wall_time': time.perf_counter() - start,
+        'workers': workers,
+        'rendered': len(jobs),
+        'skipped': len(skipped),
+    }
+    save_manifest(manifest, manifest_path)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render every scene of the repository in parallel, '
+                                                 'skipping scenes whose sources did not change.')
+    parser.add_argument('patterns', nargs='*', help="scene patterns, e.g. 'vectorclass:*' (default: all)")
+    parser.add_argument('-w', '--workers', type=int, default=None)
+    parser.add_argument('-q', '--quality', default='low', choices=list(QUALITIES))
+    parser.add_argument('-m', '--manifest', default='render_manifest.json')
+    parser.add_argument('--force', action='store_true', help='re-render unchanged scenes')
+    parser.add_argument('--dry-run', action='store_true', help='print the plan without rendering')
+    args = parser.parse_args()
+
+    manifest = run_schedule(
+        args.patterns, args.workers, args.quality, args.manifest, force=args.force,
+        dry_run=args.dry_run
+    )
+    failed = [key for key, record in manifest['scenes'].items() if 'error' in record]
+    if not args.dry_run:
+        print(f"{len(manifest['scenes']) - len(failed)} ok, {len(failed)} failed, "
+              f"manifest: {args.manifest}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
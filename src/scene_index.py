@@ -0,0 +1,349 @@
+# scene_index.py
+# 注意：这个模块不能 import manim（列出场景时不需要加载 manim），
+# 只有 render 命令才会导入 src.scene_runner
+import argparse
+import ast
+import fnmatch
+import json
+import os
+import sys
+import time
+
+from src.render_options import QUALITIES
+
+# 仓库根目录（与 scene_runner.REPO_ROOT 相同，这里不能导入 scene_runner）
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CACHE_FILE = '.scene_index.json'
+CACHE_VERSION = 1
+
+# 扫描的目录（相对仓库根目录）：场景文件在根目录，辅助模块在 src
+SCAN_DIRS = ('', 'src')
+
+# manim 自带的场景基类
+MANIM_SCENE_CLASSES = {
+    'Scene', 'MovingCameraScene', 'ThreeDScene', 'SpecialThreeDScene',
+    'ZoomedScene', 'VectorScene', 'LinearTransformationScene',
+}
+
+
+def _dotted_name(node):
+    """ast 表达式 -> 'a.b.c'，不是简单名字时返回 None"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted_name(node.value)
+        return f'{base}.{node.attr}' if base else None
+    return None
+
+
+def _resolve_relative(module_name, is_package, level, target):
+    """相对导入 -> 绝对模块名"""
+    if level == 0:
+        return target
+    parts = module_name.split('.')
+    if not is_package:
+        parts = parts[:-1]
+    parts = parts[:len(parts) - (level - 1)] if level > 1 else parts
+    return '.'.join(parts + ([target] if target else []))
+
+
+def parse_module(path, module_name):
+    """
+    静态分析一个源文件（不执行）
+
+    参数:
+    - path: 文件路径
+    - module_name: 模块名（如 'vectorclass'、'src.tex_cache'）
+
+    返回: {'classes': {类名: {'bases': [...], 'line': 行号}},
+           'aliases': {本地名: [模块, 名字或 None]}, 'star_imports': [...], 'imports': [...]}
+    """
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+    is_package = os.path.basename(path) == '__init__.py'
+
+    classes, aliases, star_imports, imports = {}, {}, [], []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes[node.name] = {
+                'bases': [name for name in map(_dotted_name, node.bases) if name],
+                'line': node.lineno,
+            }
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(alias.name)
+                if alias.asname:
+                    aliases[alias.asname] = [alias.name, None]
+                else:
+                    # import a.b 绑定的是 a
+                    top = alias.name.split('.')[0]
+                    aliases[top] = [top, None]
+        elif isinstance(node, ast.ImportFrom):
+            source = _resolve_relative(module_name, is_package, node.level, node.module)
+            imports.append(source)
+            for alias in node.names:
+                if alias.name == '*':
+                    star_imports.append(source)
+                else:
+                    aliases[alias.asname or alias.name] = [source, alias.name]
+                    # from pkg import module 也可能是子模块
+                    imports.append(f'{source}.{alias.name}')
+    return {
+        'classes': classes,
+        'aliases': aliases,
+        'star_imports': star_imports,
+        'imports': imports,
+    }
+
+
+class SceneIndex:
+    """不导入任何场景文件，静态找出仓库中的所有 Scene 子类
+
+    每个文件的分析结果按 (mtime, 大小) 缓存在 .scene_index.json 中，
+    文件没变时不会重新解析；继承关系（包括跨模块的 import / from ... import）
+    每次由缓存的结果重新推导，只是字典查找。
+    """
+
+    def __init__(self, root=REPO_ROOT, cache_path=None):
+        self.root = root
+        self.cache_path = cache_path or os.path.join(root, CACHE_FILE)
+        self.modules = {}
+        self.files = {}
+        self.unresolved = set()
+        self._cache_changed = False
+
+    def load(self):
+        cache = self._read_cache()
+        entries = {}
+        for path, module_name in self._iter_source_files():
+            stat = os.stat(path)
+            relative = os.path.relpath(path, self.root)
+            signature = [stat.st_mtime_ns, stat.st_size]
+            cached = cache.get(relative)
+            if cached and cached['signature'] == signature:
+                info = cached['info']
+            else:
+                try:
+                    info = parse_module(path, module_name)
+                except SyntaxError as error:
+                    print(f'{relative}: {error}', file=sys.stderr)
+                    continue
+                self._cache_changed = True
+            entries[relative] = {'signature': signature, 'info': info}
+            self.modules[module_name] = info
+            self.files[module_name] = relative
+
+        if set(entries) != set(cache):
+            self._cache_changed = True
+        if self._cache_changed:
+            self._write_cache(entries)
+        return self
+
+    def _iter_source_files(self):
+        for directory in SCAN_DIRS:
+            base = os.path.join(self.root, directory)
+            if not os.path.isdir(base):
+                continue
+            prefix = directory.replace(os.sep, '.') + '.' if directory else ''
+            for entry in sorted(os.scandir(base), key=lambda entry: entry.name):
+                if entry.is_file() and entry.name.endswith('.py'):
+                    name = entry.name[:-3]
+                    if name == '__init__':
+                        yield entry.path, prefix.rstrip('.')
+                    else:
+                        yield entry.path, prefix + name
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('files', {})
+
+    def _write_cache(self, entries):
+        tmp_path = f'{self.cache_path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': CACHE_VERSION, 'files': entries}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            # 只读的仓库也能用，只是没有缓存
+            pass
+
+    def _lookup(self, module_name, name, seen):
+        """
+        在模块中解析一个名字
+
+        返回: ('local', 模块, 类名) / ('manim', 名字) / None
+        """
+        if (module_name, name) in seen:
+            return None
+        seen.add((module_name, name))
+
+        info = self.modules.get(module_name)
+        if info is None:
+            if module_name == 'manim' or module_name.startswith('manim.'):
+                return ('manim', name)
+            return None
+
+        if '.' in name:
+            # 形如 vectorclass.FlexibleVectorDiagram / vc.FlexibleVectorDiagram
+            head, attribute = name.rsplit('.', 1)
+            target = self._lookup_module(module_name, head)
+            return self._lookup(target, attribute, seen) if target else None
+
+        if name in info['classes']:
+            return ('local', module_name, name)
+        if name in info['aliases']:
+            source, original = info['aliases'][name]
+            if original is not None:
+                return self._lookup(source, original, seen)
+        # 后面的 import * 覆盖前面的
+        for source in reversed(info['star_imports']):
+            found = self._lookup(source, name, seen)
+            if found is not None:
+                return found
+        return None
+
+    def _lookup_module(self, module_name, dotted):
+        """模块中的名字（import 的别名）对应的模块名"""
+        info = self.modules[module_name]
+        head, _, rest = dotted.partition('.')
+        if head in info['aliases']:
+            source, original = info['aliases'][head]
+            target = f'{source}.{original}' if original else source
+        else:
+            target = head
+        return f'{target}.{rest}' if rest else target
+
+    def _is_scene(self, module_name, class_name, seen=None):
+        seen = seen if seen is not None else set()
+        if (module_name, class_name) in seen:
+            return False
+        seen.add((module_name, class_name))
+        for base in self.modules[module_name]['classes'][class_name]['bases']:
+            found = self._lookup(module_name, base, set())
+            if found is None:
+                if base not in ('object', 'ABC'):
+                    self.unresolved.add((module_name, class_name, base))
+                continue
+            if found[0] == 'manim':
+                if found[1].split('.')[-1] in MANIM_SCENE_CLASSES:
+                    return True
+            elif self._is_scene(found[1], found[2], seen):
+                return True
+        return False
+
+    def scenes(self):
+        """
+        所有场景类
+
+        返回: 列表，每项 {'id': 'module:Scene', 'module', 'name', 'file', 'line'}
+        """
+        self.unresolved = set()
+        result = []
+        for module_name, info in self.modules.items():
+            for class_name, class_info in info['classes'].items():
+                if self._is_scene(module_name, class_name):
+                    result.append({
+                        'id': f'{module_name}:{class_name}',
+                        'module': module_name,
+                        'name': class_name,
+                        'file': self.files[module_name],
+                        'line': class_info['line'],
+                    })
+        return result
+
+    def get_dependencies(self, module_name):
+        """
+        模块直接或间接 import 的所有本仓库模块（含自身）
+
+        返回: 按名字排序的模块名列表
+        """
+        found = set()
+        stack = [module_name]
+        while stack:
+            name = stack.pop()
+            if name in found or name not in self.modules:
+                continue
+            found.add(name)
+            stack.extend(self.modules[name]['imports'])
+        return sorted(found)
+
+    def select(self, patterns=None):
+        """
+        按模式选出场景（fnmatch，匹配 'module:Scene' 或类名）
+
+        参数:
+        - patterns: 模式列表，如 ['vectorclass:*', 'Moving*']；为空时返回全部
+        """
+        scenes = self.scenes()
+        if not patterns:
+            return scenes
+        return [
+            scene for scene in scenes
+            if any(
+                fnmatch.fnmatchcase(scene['id'], pattern)
+                or fnmatch.fnmatchcase(scene['name'], pattern)
+                for pattern in patterns
+            )
+        ]
+
+
+def render_scenes(scenes, quality='low', config_overrides=None):
+    """在当前进程中依次渲染选中的场景（只有这里才导入 manim）"""
+    from src.scene_runner import render_scene, get_output_file
+
+    overrides = {'quality': QUALITIES[quality]}
+    overrides.update(config_overrides or {})
+    for scene in scenes:
+        start = time.perf_counter()
+        rendered = render_scene(scene['module'], scene['name'], overrides)
+        print(f"{scene['id']}: {time.perf_counter() - start:.1f} s -> {get_output_file(rendered)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List and render the scenes of this repository.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = commands.add_parser('list', help='list scenes (does not import manim)')
+    list_parser.add_argument('patterns', nargs='*', help="e.g. 'vectorclass:*' or 'Moving*'")
+    list_parser.add_argument('--json', action='store_true', help='print JSON')
+    list_parser.add_argument('-v', '--verbose', action='store_true',
+                             help='also report classes whose base classes could not be resolved')
+
+    render_parser = commands.add_parser('render', help='render the selected scenes')
+    render_parser.add_argument('patterns', nargs='+', help="e.g. 'vectorclass:*' or 'Moving*'")
+    render_parser.add_argument('-q', '--quality', default='low', choices=list(QUALITIES))
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = SceneIndex().load()
+    scenes = index.select(args.patterns)
+
+    if args.command == 'list':
+        if args.json:
+            print(json.dumps(scenes, indent=2))
+        else:
+            for scene in scenes:
+                print(f"{scene['id']:45s} {scene['file']}:{scene['line']}")
+        if args.verbose:
+            for module_name, class_name, base in sorted(index.unresolved):
+                print(f'unresolved base {base!r} of {module_name}:{class_name}', file=sys.stderr)
+            print(f'{len(scenes)} scenes in {(time.perf_counter() - start) * 1e3:.1f} ms',
+                  file=sys.stderr)
+        return
+
+    if not scenes:
+        parser.error(f'no scene matches {args.patterns}')
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    render_scenes(scenes, args.quality)
+
+
+if __name__ == '__main__':
+    main()
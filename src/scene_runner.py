@@ -0,0 +1,64 @@
+# scene_runner.py
+from manim import *
+import importlib
+import os
+import sys
+
+# 仓库根目录（场景文件所在位置）
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def ensure_repo_on_path():
+    """保证可以 import 根目录下的场景模块和 src 包"""
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+
+def load_scene_class(module_name, scene_name):
+    """
+    按模块名和类名加载场景类
+
+    参数:
+    - module_name: 场景文件的模块名（如 'vectorclass'）
+    - scene_name: 场景类名（如 'FlexibleVectorDiagram'）
+    """
+    ensure_repo_on_path()
+    module = importlib.import_module(module_name)
+    return getattr(module, scene_name)
+
+
+def get_module_file(module_name):
+    """模块对应的源文件路径（用于 config.input_file，决定输出目录）"""
+    return os.path.join(REPO_ROOT, *module_name.split('.')) + '.py'
+
+
+def render_scene(module_name, scene_name, config_overrides=None, scene_kwargs=None,
+                 before_render=None):
+    """
+    在当前进程中渲染一个场景
+
+    参数:
+    - module_name: 场景文件的模块名
+    - scene_name: 场景类名
+    - config_overrides: 临时覆盖的 manim 配置（如 {'quality': 'low_quality'}）
+    - scene_kwargs: 传给场景构造函数的参数
+    - before_render: 可选回调 before_render(scene)，在 render 之前调用（用于安装钩子）
+
+    返回: 渲染完成的场景对象
+    """
+    scene_cls = load_scene_class(module_name, scene_name)
+    overrides = {'input_file': get_module_file(module_name)}
+    overrides.update(config_overrides or {})
+
+    with tempconfig(overrides):
+        scene = scene_cls(**(scene_kwargs or {}))
+        if before_render is not None:
+            before_render(scene)
+        scene.render()
+    return scene
+
+
+def get_output_file(scene):
+    """场景渲染出的视频文件路径（没有写视频时返回 None）"""
+    path = getattr(scene.renderer.file_writer, 'movie_file_path', None)
+    return str(path) if path else None
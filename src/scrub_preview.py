@@ -0,0 +1,301 @@
+# scrub_preview.py
+from manim import *
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlparse
+import argparse
+import io
+import json
+import threading
+import time
+
+from src.render_options import QUALITIES
+from src.scene_runner import render_scene
+
+PAGE = Template("""<!doctype html>
+<html>
+<head><meta charset="utf-8"><title>$title</title>
+<style>
+body { font-family: sans-serif; background: #222; color: #ddd; margin: 20px; }
+img { width: 100%; max-width: 1280px; image-rendering: auto; background: #000; display: block; }
+input { width: 100%; max-width: 1280px; }
+</style>
+</head>
+<body>
+<h3>$title</h3>
+<img id="frame" alt="frame">
+<input id="value" type="range" min="$low" max="$high" step="$step" value="$value">
+<div id="info"></div>
+<script>
+const slider = document.getElementById('value');
+const img = document.getElementById('frame');
+const info = document.getElementById('info');
+slider.oninput = function () { fetch('/set?value=' + slider.value); };
+let n = 0;
+function next() { img.src = '/frame.png?n=' + (n++); }
+img.onload = function () {
+  fetch('/state').then(function (r) { return r.json(); }).then(function (s) {
+    info.textContent = 'value ' + s.value.toFixed(4) + ' | ' + s.width + 'x' + s.height +
+      ' | ' + s.render_ms.toFixed(1) + ' ms | dropped ' + s.dropped;
+  });
+  setTimeout(next, 15);
+};
+img.onerror = function () { setTimeout(next, 200); };
+next();
+</script>
+</body>
+</html>
+""")
+
+
+class ScrubPreview:
+    """拖动跟踪器的值、实时预览画面
+
+    渲染在单独的线程中进行，只渲染最新请求的值（来不及渲染的中间值直接丢弃）。
+    拖动时用低分辨率的离屏相机渲染，并根据延迟预算自动调整分辨率；
+    停下来一段时间后再按完整分辨率渲染一次。直接使用场景中已有的对象，不会重新运行 setup。
+    """
+
+    def __init__(self, scene, tracker, value_range=(0, 1), preview_scale=0.25,
+                 latency_budget=0.05, idle_delay=0.3):
+        """
+        参数:
+        - scene: 已经构建好的场景
+        - tracker: 要拖动的 ValueTracker
+        - value_range: 取值范围 (最小值, 最大值)
+        - preview_scale: 拖动时的最大分辨率比例
+        - latency_budget: 每帧渲染的目标时间（秒），超出时降低分辨率
+        - idle_delay: 停止拖动多久之后渲染完整分辨率（秒）
+        """
+        self.scene = scene
+        self.tracker = tracker
+        self.value_range = value_range
+        self.preview_scale = preview_scale
+        self.scale = preview_scale
+        self.latency_budget = latency_budget
+        self.idle_delay = idle_delay
+        self.dropped = 0
+
+        # 完整分辨率取场景渲染时的相机设置
+        camera = scene.renderer.camera
+        self.pixel_width = camera.pixel_width
+        self.pixel_height = camera.pixel_height
+        self.frame_width = camera.frame_width
+        self.frame_height = camera.frame_height
+        self.background_color = camera.background_color
+
+        self._cameras = {}
+        self._condition = threading.Condition()
+        self._requested = tracker.get_value()
+        self._pending = True
+        self._frame = None
+        self._frame_info = {}
+        self._running = False
+        self._thread = None
+
+    def request(self, value):
+        """请求显示某个值（可以在任意线程调用）"""
+        low, high = self.value_range
+        with self._condition:
+            if self._pending:
+                self.dropped += 1
+            self._requested = min(max(float(value), low), high)
+            self._pending = True
+            self._condition.notify()
+
+    def get_frame(self):
+        """最近一次渲染的 PNG 数据和信息"""
+        with self._condition:
+            return self._frame, dict(self._frame_info)
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join()
+
+    def _loop(self):
+        full_resolution = False
+        while True:
+            with self._condition:
+                if not self._pending:
+                    self._condition.wait(self.idle_delay)
+                if not self._running:
+                    return
+                if self._pending:
+                    value, scale = self._requested, self.scale
+                    self._pending = False
+                elif not full_resolution:
+                    value, scale = self._requested, 1.0
+                else:
+                    continue
+
+            start = time.perf_counter()
+            png, size = self._render(value, scale)
+            elapsed = time.perf_counter() - start
+            full_resolution = scale == 1.0
+            if not full_resolution:
+                self._adapt(elapsed)
+
+            with self._condition:
+                self._frame = png
+                self._frame_info = {
+                    'value': value,
+                    'width': size[0],
+                    'height': size[1],
+                    'render_ms': elapsed * 1e3,
+                    'dropped': self.dropped,
+                }
+
+    def _adapt(self, elapsed):
+        """按延迟预算调整预览分辨率（以 0.05 为步长，避免创建太多相机）"""
+        if elapsed > self.latency_budget:
+            scale = self.scale * 0.8
+        elif elapsed < self.latency_budget / 2:
+            scale = self.scale * 1.25
+        else:
+            return
+        self.scale = min(max(round(scale * 20) / 20, 0.05), self.preview_scale)
+
+    def _get_camera(self, scale):
+        width = max(int(self.pixel_width * scale) // 2 * 2, 16)
+        height = max(int(self.pixel_height * scale) // 2 * 2, 16)
+        if (width, height) not in self._cameras:
+            self._cameras[width, height] = Camera(
+                pixel_width=width,
+                pixel_height=height,
+                frame_width=self.frame_width,
+                frame_height=self.frame_height,
+                background_color=self.background_color,
+            )
+        return self._cameras[width, height]
+
+    def _render(self, value, scale):
+        """在离屏相机上渲染一帧，返回 (PNG 数据, (宽, 高))"""
+        scene = self.scene
+        self.tracker.set_value(value)
+        scene.update_mobjects(0)
+
+        mobjects = list(scene.mobjects) + [
+            mob for mob in scene.foreground_mobjects if mob not in scene.mobjects
+        ]
+        camera = self._get_camera(scale)
+        camera.reset()
+        camera.capture_mobjects(mobjects)
+        image = camera.get_image()
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG')
+        return buffer.getvalue(), image.size
+
+
+def make_handler(preview, title='scrub preview'):
+    """为 ScrubPreview 创建 HTTP 请求处理类"""
+    low, high = preview.value_range
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/':
+                page = PAGE.substitute(
+                    title=title, low=low, high=high, step=(high - low) / 1000,
+                    value=preview.tracker.get_value()
+                )
+                self._send(200, 'text/html; charset=utf-8', page.encode())
+            elif url.path == '/set':
+                try:
+                    preview.request(float(parse_qs(url.query)['value'][0]))
+                except (KeyError, ValueError):
+                    self._send(400, 'text/plain', b'bad value')
+                    return
+                self._send(204, 'text/plain', b'')
+            elif url.path == '/frame.png':
+                png, _ = preview.get_frame()
+                if png is None:
+                    self._send(503, 'text/plain', b'not ready')
+                else:
+                    self._send(200, 'image/png', png)
+            elif url.path == '/state':
+                _, info = preview.get_frame()
+                info.setdefault('value', preview.tracker.get_value())
+                info.setdefault('width', 0)
+                info.setdefault('height', 0)
+                info.setdefault('render_ms', 0.0)
+                info.setdefault('dropped', preview.dropped)
+                self._send(200, 'application/json', json.dumps(info).encode())
+            else:
+                self._send(404, 'text/plain', b'not found')
+
+        def _send(self, status, content_type, body):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def find_tracker(scene, name=None):
+    """按属性名找跟踪器；不指定时取场景中的第一个 ValueTracker"""
+    if name:
+        tracker = scene
+        for part in name.split('.'):
+            tracker = getattr(tracker, part)
+        return tracker
+    for mobject in scene.mobjects:
+        for member in mobject.get_family():
+            if isinstance(member, ValueTracker):
+                return member
+    raise ValueError(f"{type(scene).__name__} has no ValueTracker in its mobjects")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scrub a ValueTracker of a scene in the browser.')
+    parser.add_argument('module', help="scene module, e.g. 'vectorclass'")
+    parser.add_argument('scene', help="scene class, e.g. 'FlexibleVectorDiagram'")
+    parser.add_argument('--tracker', help="tracker attribute, e.g. 'alpha_tracker' (default: first ValueTracker)")
+    parser.add_argument('--range', nargs=2, type=float, default=(0, 1), metavar=('LOW', 'HIGH'))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--preview-scale', type=float, default=0.25)
+    parser.add_argument('--budget-ms', type=float, default=50)
+    parser.add_argument('-q', '--quality', default='high', choices=list(QUALITIES))
+    args = parser.parse_args()
+
+    # 跳过模式运行一遍，只为得到最终的场景状态（不光栅化任何帧）
+    scene = render_scene(args.module, args.scene, {
+        'quality': QUALITIES[args.quality],
+        'save_last_frame': True,
+        'write_to_movie': False,
+        'disable_caching': True,
+        'progress_bar': 'none',
+    })
+    tracker = find_tracker(scene, args.tracker)
+    preview = ScrubPreview(
+        scene, tracker, tuple(args.range), args.preview_scale, args.budget_ms / 1e3
+    ).start()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(preview, args.scene))
+    print(f'scrub preview on http://{args.host}:{args.port}/ (Ctrl+C to stop)')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        preview.stop()
+
+
+if __name__ == '__main__':
+    main()
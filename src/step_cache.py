@@ -0,0 +1,137 @@
+# step_cache.py
+from manim import *
+import manim
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+
+def _digest(value):
+    """把任意可 JSON 序列化的数据变成稳定的哈希"""
+    text = json.dumps(value, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()[:24]
+
+
+class StepCache:
+    """按步骤保存渲染好的片段（partial movie files），跨进程、跨场景子类复用
+
+    每一步的键 = 上一步的键 + 这一步的输入，第一步的键由配置输入、
+    画质设置和之前已经渲染的片段决定。所以某一步的键相同，
+    就说明这一步开始前的场景状态和这一步的内容都没有变。
+
+    每一步开始前，把缓存中这一步的片段按 manim 的哈希文件名放进
+    当前场景的 partial_movie_files 目录，manim 计算出相同的哈希时
+    就会直接使用这些片段；结束后把新渲染的片段存进缓存。
+    片段是否可用最终仍由 manim 自己的哈希判断，缓存不会放进错误的画面。
+    """
+
+    def __init__(self, scene, inputs, cache_dir=None):
+        """
+        参数:
+        - scene: 场景对象
+        - inputs: 决定场景内容的输入（可 JSON 序列化，如向量、颜色、标签）
+        - cache_dir: 缓存目录（默认 media_dir/step_cache）
+        """
+        self.scene = scene
+        self.cache_dir = cache_dir or os.path.join(config.media_dir, 'step_cache')
+        self.hits = 0
+        self.misses = 0
+
+        file_writer = scene.renderer.file_writer
+        previous_files = [
+            os.path.basename(path) if path else None
+            for path in getattr(file_writer, 'partial_movie_files', [])
+        ]
+        self.key = _digest({
+            'manim': manim.__version__,
+            'inputs': inputs,
+            'pixel_width': config.pixel_width,
+            'pixel_height': config.pixel_height,
+            'frame_rate': config.frame_rate,
+            'background_color': str(config.background_color),
+            'extension': config.movie_file_extension,
+            'previous_files': previous_files,
+        })
+
+    def is_enabled(self):
+        """只有在写视频、开启缓存并且没有跳过动画时才有意义"""
+        renderer = self.scene.renderer
+        return (
+            config.write_to_movie
+            and not config.disable_caching
+            and not renderer.skip_animations
+            and hasattr(renderer.file_writer, 'partial_movie_directory')
+        )
+
+    @contextmanager
+    def step(self, *step_inputs):
+        """
+        包住一步的所有 play / wait
+
+        用法:
+            with step_cache.step(element_type, duration, lag_ratio):
+                self.play(...)
+                self.wait(0.5)
+        """
+        self.key = _digest([self.key, step_inputs])
+        if not self.is_enabled():
+            yield
+            return
+
+        file_writer = self.scene.renderer.file_writer
+        if self._stage(self.key, file_writer.partial_movie_directory):
+            self.hits += 1
+        else:
+            self.misses += 1
+        first = len(file_writer.partial_movie_files)
+        yield
+        self._harvest(self.key, file_writer.partial_movie_files[first:])
+
+    def _get_step_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def _stage(self, key, partial_movie_directory):
+        """把缓存中的片段放进场景的片段目录，返回是否命中"""
+        step_dir = self._get_step_dir(key)
+        record_path = os.path.join(step_dir, 'record.json')
+        if not os.path.exists(record_path):
+            return False
+        with open(record_path) as f:
+            names = json.load(f)['files']
+        for name in names:
+            target = os.path.join(partial_movie_directory, name)
+            if not os.path.exists(target):
+                _link_or_copy(os.path.join(step_dir, name), target)
+        return True
+
+    def _harvest(self, key, partial_files):
+        """把这一步渲染出的片段存入缓存（只存完整的步骤）"""
+        step_dir = self._get_step_dir(key)
+        if os.path.exists(step_dir) or not partial_files:
+            return
+        if any(path is None or not os.path.exists(path) for path in partial_files):
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f'.{key}-', dir=self.cache_dir)
+        names = [os.path.basename(path) for path in partial_files]
+        for path, name in zip(partial_files, names):
+            _link_or_copy(path, os.path.join(tmp_dir, name))
+        with open(os.path.join(tmp_dir, 'record.json'), 'w') as f:
+            json.dump({'files': names}, f)
+        try:
+            os.rename(tmp_dir, step_dir)
+        except OSError:
+            # 另一个进程已经存好了同一步
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _link_or_copy(source, target):
+    """优先用硬链接（不占额外空间），跨文件系统时复制"""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
@@ -0,0 +1,239 @@
+# streaming_path.py
+from manim import *
+import numpy as np
+
+# 直线段对应的三次贝塞尔控制点比例
+_SEGMENT_THIRDS = np.array([0, 1 / 3, 2 / 3, 1])[:, np.newaxis]
+
+
+def _rdp_mask(points, tolerance):
+    """
+    Ramer-Douglas-Peucker 化简，返回要保留的点的布尔掩码
+
+    去掉的点到化简后折线的距离都不超过 tolerance，首尾两点总是保留。
+    """
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        segment = points[end] - points[start]
+        offsets = points[start + 1:end] - points[start]
+        length_sq = segment @ segment
+        # 到线段（不是直线）的距离，折返的轨迹也能正确处理
+        if length_sq > 0:
+            t = np.clip(offsets @ segment / length_sq, 0, 1)
+            offsets = offsets - t[:, np.newaxis] * segment
+        distances = np.linalg.norm(offsets, axis=1)
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            middle = start + 1 + index
+            keep[middle] = True
+            stack.append((start, middle))
+            stack.append((middle, end))
+    return keep
+
+
+class StreamingPath(VMobject):
+    """不断追加采样点的折线轨迹 - 作为一条路径渲染
+
+    采样点和贝塞尔控制点都保存在预先分配、按倍数扩容的 NumPy 缓冲区里，
+    每次追加只写入新的一段（均摊 O(1)），不会每帧新建 Line 对象。
+
+    设置 max_points 后采样点数不会超过它：缓冲区满时依次
+    1. 丢掉画面外的所有线段（轨迹在那里断开，之后回到画面内的部分照常保留）；
+    2. 用 RDP 化简还没化简过的点（误差不超过 tolerance，默认半个像素）；
+    3. 仍然超过上限的 3/4 时，加倍误差重新化简，最后均匀抽稀（给出一次警告）。
+    """
+
+    def __init__(self, start_point=None, capacity=256, stroke_color=YELLOW_D,
+                 stroke_width=DEFAULT_STROKE_WIDTH, max_points=None, tolerance=None,
+                 **kwargs):
+        """
+        参数:
+        - start_point: 起点（可选）
+        - capacity: 初始缓冲区能容纳的采样点数
+        - stroke_color: 线条颜色
+        - stroke_width: 线条宽度
+        - max_points: 最多保存的采样点数（None 表示不限制）
+        - tolerance: 化简允许的最大偏差（默认半个像素对应的长度）
+        """
+        super().__init__(stroke_color=stroke_color, stroke_width=stroke_width, **kwargs)
+        self.max_points = max(int(max_points), 8) if max_points else None
+        self.tolerance = tolerance
+        capacity = max(int(capacity), 2)
+        if self.max_points:
+            capacity = min(capacity, self.max_points)
+        self._samples = np.zeros((capacity, 3))
+        # _breaks[i] 为 True 时第 i-1 个点和第 i 个点之间没有线段（中间的部分在画面外被丢掉了）
+        self._breaks = np.zeros(capacity, dtype=bool)
+        self._curve_points = np.zeros((4 * capacity, 3))
+        self._count = 0
+        # 前 _simplified 个点已经化简过，不再重复化简（避免误差累积）
+        self._simplified = 0
+        self._thinned = False
+
+        if start_point is not None:
+            self.add_sample(start_point)
+
+    def add_sample(self, point):
+        """在轨迹末尾追加一个采样点"""
+        point = np.asarray(point, dtype=float)
+        n = self._count
+        # 与上一个点重合时不追加（例如动点停止后）
+        if n > 0 and np.array_equal(point, self._samples[n - 1]):
+            return self
+        if n == len(self._samples):
+            if self.max_points and n >= self.max_points:
+                self._compact()
+                n = self._count
+            if n == len(self._samples):
+                self._grow()
+
+        self._samples[n] = point
+        self._breaks[n] = False
+        if n > 0:
+            previous = self._samples[n - 1]
+            self._curve_points[4 * (n - 1):4 * n] = (
+                previous + _SEGMENT_THIRDS * (point - previous)
+            )
+        self._count = n + 1
+
+        # 直接引用缓冲区的前缀，不复制
+        self.points = self._curve_points[:4 * n]
+        return self
+
+    def get_samples(self):
+        """返回当前所有采样点（副本）"""
+        return self._samples[:self._count].copy()
+
+    def get_num_samples(self):
+        return self._count
+
+    def clear_samples(self):
+        """清空轨迹（保留缓冲区）"""
+        self._count = 0
+        self._simplified = 0
+        self.points = self._curve_points[:0]
+        return self
+
+    def get_tolerance(self):
+        """化简允许的最大偏差（默认半个像素）"""
+        if self.tolerance is not None:
+            return self.tolerance
+        return 0.5 * config.frame_width / config.pixel_width
+
+    def _segment_visible(self, samples, breaks):
+        """每条线段是否可能出现在画面内（包围盒与画面加线宽余量相交）"""
+        margin = 0.1
+        radius = np.array([config.frame_width / 2 + margin, config.frame_height / 2 + margin])
+        first, second = samples[:-1, :2], samples[1:, :2]
+        lower = np.minimum(first, second)
+        upper = np.maximum(first, second)
+        visible = ((lower <= radius) & (upper >= -radius)).all(axis=1)
+        return visible & ~breaks[1:]
+
+    def _compact(self):
+        """缓冲区满时释放空间：丢弃画面外的线段并化简，保证不超过 max_points"""
+        n = self._count
+        samples = self._samples[:n]
+        breaks = self._breaks[:n]
+
+        # 保留可见线段的端点和最后一个点（之后的线段从它接出去）
+        segment_visible = self._segment_visible(samples, breaks)
+        keep = np.zeros(n, dtype=bool)
+        keep[:-1] |= segment_visible
+        keep[1:] |= segment_visible
+        keep[-1] = True
+        indices = np.flatnonzero(keep)
+        # 相邻保留点之间原来不是一条可见线段时断开
+        connected = (np.diff(indices) == 1) & segment_visible[indices[:-1]]
+        samples = samples[indices]
+        breaks = np.concatenate([[True], ~connected])
+        simplified = int(np.count_nonzero(indices < self._simplified))
+
+        # 只化简新加入的部分，和已化简部分共用一个衔接点
+        start = max(simplified - 1, 0)
+        keep = np.ones(len(samples), dtype=bool)
+        keep[start:] = self._simplify(samples[start:], breaks[start:], self.get_tolerance())
+        samples, breaks = samples[keep], breaks[keep]
+
+        # 仍然太多：误差加倍重新化简全部点，还不够就均匀抽稀
+        target = self.max_points * 3 // 4
+        tolerance = self.get_tolerance()
+        for _ in range(4):
+            if len(samples) <= target:
+                break
+            tolerance *= 2
+            keep = self._simplify(samples, breaks, tolerance)
+            samples, breaks = samples[keep], breaks[keep]
+        if len(samples) > target:
+            samples, breaks = self._thin(samples, breaks, target)
+            if not self._thinned:
+                self._thinned = True
+                logger.warning(
+                    "StreamingPath: more than %d points remain visible after simplification, "
+                    "thinning the trace evenly", target
+                )
+
+        count = len(samples)
+        self._samples[:count] = samples
+        self._breaks[:count] = breaks
+        self._breaks[0] = False
+        self._count = count
+        self._simplified = count
+        self._rebuild_curve_points()
+
+    @staticmethod
+    def _simplify(samples, breaks, tolerance):
+        """对每段连续的轨迹分别做 RDP 化简，返回保留点的掩码"""
+        keep = np.ones(len(samples), dtype=bool)
+        bounds = list(np.flatnonzero(breaks[1:]) + 1)
+        for start, end in zip([0] + bounds, bounds + [len(samples)]):
+            keep[start:end] = _rdp_mask(samples[start:end], tolerance)
+        return keep
+
+    @staticmethod
+    def _thin(samples, breaks, count):
+        """
+        均匀抽取 count 个点（包含首尾），被跳过的点之间有断开时保留断开
+
+        返回: (采样点, 断开标记)
+        """
+        indices = np.unique(np.linspace(0, len(samples) - 1, count).round().astype(int))
+        broken = np.concatenate([[0], np.cumsum(breaks[1:])])
+        thinned_breaks = np.concatenate([[True], np.diff(broken[indices]) > 0])
+        return samples[indices], thinned_breaks
+
+    def _rebuild_curve_points(self):
+        """由采样点重新计算全部贝塞尔控制点（断开处是一段退化为一个点的曲线，开始新的子路径）"""
+        n = self._count
+        if n > 1:
+            previous = self._samples[:n - 1, np.newaxis, :]
+            following = self._samples[1:n, np.newaxis, :]
+            curves = previous + _SEGMENT_THIRDS[np.newaxis] * (following - previous)
+            breaks = self._breaks[1:n]
+            curves[breaks] = following[breaks]
+            self._curve_points[:4 * (n - 1)] = curves.reshape(-1, 3)
+        self.points = self._curve_points[:4 * max(n - 1, 0)]
+
+    def _grow(self):
+        """缓冲区容量翻倍（设置了 max_points 时不超过它）"""
+        capacity = 2 * len(self._samples)
+        if self.max_points:
+            capacity = min(capacity, self.max_points)
+        samples = np.zeros((capacity, 3))
+        samples[:self._count] = self._samples[:self._count]
+        breaks = np.zeros(capacity, dtype=bool)
+        breaks[:self._count] = self._breaks[:self._count]
+        curve_points = np.zeros((4 * capacity, 3))
+        used = 4 * max(self._count - 1, 0)
+        curve_points[:used] = self._curve_points[:used]
+        self._samples = samples
+        self._breaks = breaks
+        self._curve_points = curve_points
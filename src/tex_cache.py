@@ -0,0 +1,254 @@
+# tex_cache.py
+from manim import *
+from collections import OrderedDict
+import hashlib
+import os
+import pickle
+import sys
+
+import manim
+import numpy as np
+from manim.utils.tex_file_writing import tex_hash
+
+
+class TexCache:
+    """MathTex 缓存 - 相同内容只解析一次 TeX/SVG
+
+    两级缓存：
+    - 内存：LRU，保存已解析好的 MathTex，取出时返回副本
+    - 磁盘：按内容哈希保存序列化后的几何数据，多次渲染之间共享，总大小有上限
+    """
+
+    def __init__(self, max_items=256, cache_dir=None, max_disk_bytes=64 * 1024 * 1024):
+        """
+        参数:
+        - max_items: 内存中最多保存的条目数
+        - cache_dir: 磁盘缓存目录（默认 media_dir/tex_cache，None 时按 config 计算）
+        - max_disk_bytes: 磁盘缓存总大小上限（字节），0 表示不使用磁盘缓存
+        """
+        self.max_items = max_items
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._items = OrderedDict()
+
+        # 命中统计
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, *tex_strings, scale=1, color=None, tex_template=None):
+        """
+        取出一个 MathTex（总是返回新的副本，可以自由修改）
+
+        参数:
+        - tex_strings: 传给 MathTex 的字符串
+        - scale: 缩放系数
+        - color: 颜色（None 表示使用默认颜色）
+        - tex_template: TeX 模板（None 表示使用 config 中的模板）
+        """
+        key = self.make_key(*tex_strings, scale=scale, color=color,
+                            tex_template=tex_template)
+
+        mob = self._items.get(key)
+        if mob is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return mob.copy()
+
+        mob = self._load(key)
+        if mob is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            mob = self.build(*tex_strings, scale=scale, color=color,
+                             tex_template=tex_template)
+            self._store(key, mob)
+
+        self._items[key] = mob
+        if len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+        return mob.copy()
+
+    def contains(self, *tex_strings, scale=1, color=None, tex_template=None):
+        """
+        检查创建该条目时是否还需要编译 LaTeX
+
+        内存、磁盘缓存中已有该条目，或者 manim 的 Tex 目录里已经有
+        MathTex(*tex_strings) 要用的所有 SVG 文件时返回 True。
+        """
+        key = self.make_key(*tex_strings, scale=scale, color=color,
+                            tex_template=tex_template)
+        if key in self._items or os.path.exists(self._path(key)):
+            return True
+        try:
+            paths = self.get_svg_paths(*tex_strings, tex_template=tex_template)
+        except Exception:
+            # manim 内部实现变化时只是少一次跳过，不影响结果
+            return False
+        return all(path.exists() for path in paths)
+
+    @staticmethod
+    def get_svg_paths(*tex_strings, tex_template=None):
+        """
+        MathTex(*tex_strings) 会读取的 SVG 文件（manim 按 TeX 源码的哈希缓存在 Tex 目录）
+
+        与 MathTex 的处理相同：整个表达式编译一次，每个子串再各编译一次。
+        """
+        template = tex_template if tex_template is not None else config.tex_template
+        # 只借用 MathTex 拆分和改写字符串的方法，不创建对象
+        probe = MathTex.__new__(MathTex)
+        probe.substrings_to_isolate = []
+        probe.tex_to_color_map = {}
+        probe.brace_notation_split_occurred = False
+        pieces = probe._break_up_tex_strings(tex_strings)
+
+        tex_dir = config.get_dir('tex_dir')
+        paths = []
+        for expression in dict.fromkeys([' '.join(pieces)] + pieces):
+            texcode = template.get_texcode_for_expression_in_env(
+                probe._get_modified_expression(expression), 'align*'
+            )
+            paths.append(tex_dir / (tex_hash(texcode) + '.svg'))
+        return paths
+
+    @staticmethod
+    def build(*tex_strings, scale=1, color=None, tex_template=None):
+        """真正创建 MathTex（会调用 latex + dvisvgm 并解析 SVG）"""
+        kwargs = {}
+        if tex_template is not None:
+            kwargs['tex_template'] = tex_template
+        mob = MathTex(*tex_strings, **kwargs)
+        if scale != 1:
+            mob.scale(scale)
+        if color is not None:
+            mob.set_color(color)
+        return mob
+
+    @staticmethod
+    def make_key(*tex_strings, scale=1, color=None, tex_template=None):
+        """
+        按 TeX 内容、模板、缩放和颜色计算内容哈希
+
+        也包含 manim、NumPy 和 Python 版本，升级后不会读到旧版本写的 pickle。
+        """
+        template = tex_template if tex_template is not None else config.tex_template
+        parts = [
+            manim.__version__,
+            np.__version__,
+            '%d.%d' % sys.version_info[:2],
+            '\x00'.join(tex_strings),
+            template.body,
+            repr(float(scale)),
+            '' if color is None else ManimColor(color).to_hex(with_alpha=True),
+        ]
+        return hashlib.sha256('\x01'.join(parts).encode('utf-8')).hexdigest()
+
+    def stats(self):
+        """命中统计（方便写日志）"""
+        total = self.hits + self.disk_hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.disk_hits) / total if total else 0.0,
+            'items': len(self._items),
+        }
+
+    def log_stats(self):
+        """把命中统计输出到 manim 日志"""
+        stats = self.stats()
+        logger.info(
+            "TeX cache: %(hits)d hits, %(disk_hits)d disk hits, "
+            "%(misses)d misses (hit rate %(hit_rate).1f%%)",
+            {**stats, 'hit_rate': stats['hit_rate'] * 100},
+        )
+
+    def clear(self):
+        """清空内存缓存（不删除磁盘文件）"""
+        self._items.clear()
+
+    # ====================== 磁盘缓存 ======================
+    def get_cache_dir(self):
+        if self.cache_dir is not None:
+            return self.cache_dir
+        return os.path.join(config.media_dir, 'tex_cache')
+
+    def _path(self, key):
+        return os.path.join(self.get_cache_dir(), key + '.pkl')
+
+    def _load(self, key):
+        if not self.max_disk_bytes:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                mob = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # 损坏或与当前版本不兼容的文件（unpickle 可能抛出任何异常）：删掉，重新编译
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        # 更新访问时间，淘汰时按最久未使用的顺序
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return mob
+
+    def _store(self, key, mob):
+        if not self.max_disk_bytes:
+            return
+        cache_dir = self.get_cache_dir()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            data = pickle.dumps(mob, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            return
+        # 先写临时文件再改名，多个进程同时写入也不会读到半个文件
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        self._trim_disk(cache_dir)
+
+    def _trim_disk(self, cache_dir):
+        """磁盘缓存超过上限时删除最久未使用的文件"""
+        entries = []
+        total = 0
+        for entry in os.scandir(cache_dir):
+            if not entry.name.endswith('.pkl'):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+# 进程内共享的默认缓存
+tex_cache = TexCache()
+
+
+def cached_math_tex(*tex_strings, scale=1, color=None, tex_template=None):
+    """从默认缓存中取出 MathTex 副本，用法与 MathTex(...).scale(...).set_color(...) 相同"""
+    return tex_cache.get(*tex_strings, scale=scale, color=color,
+                         tex_template=tex_template)
@@ -0,0 +1,82 @@
+# tex_warmup.py
+from manim import *
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+
+from src.tex_cache import tex_cache
+
+
+def _normalize_item(item):
+    """把一个条目统一成 tex_cache.get 的参数"""
+    if isinstance(item, str):
+        return {'tex_strings': (item,)}
+    if isinstance(item, dict):
+        item = dict(item)
+        tex_strings = item.pop('tex_strings')
+        if isinstance(tex_strings, str):
+            tex_strings = (tex_strings,)
+        return {'tex_strings': tuple(tex_strings), **item}
+    return {'tex_strings': tuple(item)}
+
+
+def _compile_item(item, media_dir, tex_dir):
+    """在子进程中编译一个条目（结果写入共享的 Tex 目录和磁盘缓存）"""
+    config.media_dir = media_dir
+    config.tex_dir = tex_dir
+    options = dict(item)
+    tex_strings = options.pop('tex_strings')
+    tex_cache.get(*tex_strings, **options)
+
+
+def precompile_tex(items, workers=None):
+    """
+    在开始渲染前并行编译场景需要的所有 TeX 字符串
+
+    每个 MathTex 都要等待一次 latex + dvisvgm 子进程，串行创建时
+    冷启动时间随标签数量线性增长。这里先用进程池并行编译，
+    结果写入 Tex 目录和 tex_cache 的磁盘缓存，之后场景中创建
+    同样的 MathTex 就不会再调用 LaTeX。
+
+    参数:
+    - items: 条目列表，每一项可以是
+        - 字符串：MathTex(s)
+        - 字符串元组：MathTex(*strings)
+        - 字典：{'tex_strings': ..., 'scale': ..., 'color': ...}（与 cached_math_tex 参数相同）
+    - workers: 进程数（默认 CPU 核数）。在子进程中（batch_render、parallel_render、
+      render_scheduler 的工作进程）总是串行编译，否则总进程数会变成 工作进程数 × CPU 核数
+
+    返回: 实际编译的条目数
+    """
+    pending = []
+    seen = set()
+    for item in items:
+        item = _normalize_item(item)
+        if not any(item['tex_strings']):
+            continue
+        options = {k: v for k, v in item.items() if k != 'tex_strings'}
+        key = tex_cache.make_key(*item['tex_strings'], **options)
+        if key in seen or tex_cache.contains(*item['tex_strings'], **options):
+            continue
+        seen.add(key)
+        pending.append(item)
+
+    if not pending:
+        return 0
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    if multiprocessing.parent_process() is not None:
+        workers = 1
+    if workers == 1:
+        for item in pending:
+            _compile_item(item, config.media_dir, config.tex_dir)
+        return len(pending)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_compile_item, item, config.media_dir, config.tex_dir)
+            for item in pending
+        ]
+        for future in futures:
+            future.result()
+    return len(pending)
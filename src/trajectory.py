@@ -0,0 +1,146 @@
+# trajectory.py
+from manim import *
+import argparse
+import numpy as np
+
+from src.scene_runner import load_scene_class
+
+
+class TrackerTimeline:
+    """只用数字模拟一个 ValueTracker 的动画序列
+
+    按和 manim 相同的方式取帧时间（每次 play 取 np.arange(0, run_time, 1/fps)），
+    用同样的 rate_func 插值，不创建任何 mobject，也不调用 TeX 或 Cairo。
+    """
+
+    def __init__(self, initial_value=0.0):
+        self.initial_value = float(initial_value)
+        self.value = float(initial_value)
+        # 每一段: (名字, 时长, 起始值, 目标值, rate_func)
+        self.segments = []
+
+    @property
+    def duration(self):
+        return sum(segment[1] for segment in self.segments)
+
+    def animate(self, target, run_time=1, rate_func=smooth, name='move'):
+        """相当于 play(tracker.animate.set_value(target), run_time=..., rate_func=...)"""
+        self.segments.append((name, run_time, self.value, float(target), rate_func))
+        self.value = float(target)
+        return self
+
+    def wait(self, duration=1, name='wait'):
+        """跟踪器不变的一次 play（wait 或者不涉及跟踪器的动画）"""
+        self.segments.append((name, duration, self.value, self.value, linear))
+        return self
+
+    def sample(self, frame_rate=None):
+        """
+        取每一帧的时间和跟踪器的值
+
+        返回: 字典
+        - time: 每帧的场景时间，形状 (N,)
+        - value: 每帧跟踪器的值，形状 (N,)
+        - play: 每帧属于第几次 play，形状 (N,)
+        - names: 每次 play 的名字列表
+        """
+        frame_rate = frame_rate or config.frame_rate
+        times, values, plays = [], [], []
+        start = 0.0
+        for index, (name, run_time, begin, end, rate_func) in enumerate(self.segments):
+            local = np.arange(0, run_time, 1 / frame_rate)
+            alphas = np.array([rate_func(t) for t in local / run_time], dtype=float)
+            times.append(start + local)
+            values.append(begin + alphas * (end - begin))
+            plays.append(np.full(len(local), index))
+            start += run_time
+        if not self.segments:
+            return {'time': np.zeros(0), 'value': np.zeros(0), 'play': np.zeros(0, dtype=int), 'names': []}
+        return {
+            'time': np.concatenate(times),
+            'value': np.concatenate(values),
+            'play': np.concatenate(plays),
+            'names': [segment[0] for segment in self.segments],
+        }
+
+
+def box_in_frame(lower_left, size, margin=0.0):
+    """
+    判断一组矩形是否完全在画面内
+
+    参数:
+    - lower_left: 矩形左下角，形状 (N, 3)
+    - size: 矩形宽高 (width, height)
+    - margin: 与画面边缘至少保留的距离
+    """
+    x_radius = config.frame_width / 2 - margin
+    y_radius = config.frame_height / 2 - margin
+    width, height = size
+    left, bottom = lower_left[:, 0], lower_left[:, 1]
+    return (
+        (left >= -x_radius) & (left + width <= x_radius) &
+        (bottom >= -y_radius) & (bottom + height <= y_radius)
+    )
+
+
+def export_trajectory(data, path):
+    """
+    导出轨迹数组
+
+    参数:
+    - data: evaluate_trajectory 返回的字典（值为 NumPy 数组）
+    - path: .npz 或 .csv 文件路径；CSV 中 (N, 3) 的数组拆成 _x/_y/_z 三列
+    """
+    arrays = {key: np.asarray(value) for key, value in data.items() if key != 'names'}
+    if not path.endswith('.csv'):
+        np.savez(path, **arrays)
+        return path
+
+    columns, headers = [], []
+    for key, array in arrays.items():
+        if array.ndim == 2:
+            for axis, suffix in enumerate('xyz'[:array.shape[1]]):
+                columns.append(array[:, axis])
+                headers.append(f'{key}_{suffix}')
+        else:
+            columns.append(array)
+            headers.append(key)
+    np.savetxt(path, np.column_stack(columns).astype(float), delimiter=',',
+               header=','.join(headers), comments='')
+    return path
+
+
+def summarize(data):
+    """CLI 打印的摘要；返回 (文本, 是否有标签离开画面)"""
+    lines = [f"frames: {len(data['time'])}, duration: {data['time'][-1] if len(data['time']) else 0:.2f}s"]
+    out_of_frame = False
+    for key, array in data.items():
+        if key.endswith('_in_frame'):
+            bad = int(np.count_nonzero(~array))
+            out_of_frame |= bad > 0
+            lines.append(f'{key}: {bad} frames outside')
+        elif key.endswith('_length'):
+            lines.append(f'{key}: min {array.min():.3f}, max {array.max():.3f}')
+    return '\n'.join(lines), out_of_frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluate a scene trajectory without rendering.')
+    parser.add_argument('module', help="scene module, e.g. 'vectorclass'")
+    parser.add_argument('scene', help="scene class, e.g. 'FlexibleVectorDiagram'")
+    parser.add_argument('-o', '--output', help='write the arrays to a .npz or .csv file')
+    parser.add_argument('--fps', type=float, default=None)
+    parser.add_argument('--check', action='store_true', help='exit 1 if a label leaves the frame')
+    args = parser.parse_args()
+
+    scene_cls = load_scene_class(args.module, args.scene)
+    data = scene_cls.evaluate_trajectory(frame_rate=args.fps)
+    if args.output:
+        export_trajectory(data, args.output)
+    text, out_of_frame = summarize(data)
+    print(text)
+    return 1 if args.check and out_of_frame else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,221 @@
+# updater_profiler.py
+from manim import *
+import functools
+import json
+import os
+import time
+import tracemalloc
+
+# 设置这个环境变量后启用统计；值为 "memory" 时同时统计内存分配
+PROFILE_ENV = 'MANIM_PROFILE_UPDATERS'
+
+
+class UpdaterStats:
+    """一个 updater 的统计数据"""
+
+    def __init__(self, name):
+        self.name = name
+        self.durations = []
+        self.allocated = 0
+
+    def record(self, duration, allocated=0):
+        self.durations.append(duration)
+        self.allocated += allocated
+
+    def summary(self):
+        durations = sorted(self.durations)
+        count = len(durations)
+        total = sum(durations)
+        p95 = durations[min(int(count * 0.95), count - 1)] if count else 0.0
+        return {
+            'name': self.name,
+            'calls': count,
+            'total': total,
+            'mean': total / count if count else 0.0,
+            'p95': p95,
+            'allocated_bytes': self.allocated,
+        }
+
+
+class _TimedUpdater:
+    """包装一个 updater，记录每次调用的耗时
+
+    保留原函数的签名（manim 根据参数里有没有 dt 决定怎么调用），
+    并且与原函数比较相等，remove_updater(原函数) 仍然有效。
+    """
+
+    def __init__(self, func, stats, trace_memory=False):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.stats = stats
+        self.trace_memory = trace_memory
+
+    def __call__(self, mobject, *args):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            return self.func(mobject, *args)
+        finally:
+            duration = time.perf_counter() - start
+            allocated = 0
+            if self.trace_memory:
+                allocated = max(tracemalloc.get_traced_memory()[1] - before, 0)
+            self.stats.record(duration, allocated)
+
+    def __eq__(self, other):
+        return other is self or other == self.func
+
+    def __hash__(self):
+        return hash(self.func)
+
+
+class UpdaterProfiler:
+    """统计场景中每个 updater / always_redraw 的耗时
+
+    每帧更新前把场景里还没有包装的 updater 换成计时版本，
+    场景结束（tear_down）时输出表格并写入 JSON 文件。
+    """
+
+    def __init__(self, scene, trace_memory=False, output_dir=None):
+        """
+        参数:
+        - scene: 场景对象
+        - trace_memory: 是否用 tracemalloc 统计每次调用分配的内存（会变慢）
+        - output_dir: JSON 输出目录（默认 media_dir/updater_profiles）
+        """
+        self.scene = scene
+        self.trace_memory = trace_memory
+        self.output_dir = output_dir
+        self.stats = {}
+
+    def install(self):
+        """替换场景的 update_mobjects 和 tear_down"""
+        scene = self.scene
+        update_mobjects = scene.update_mobjects
+        tear_down = scene.tear_down
+
+        def profiled_update_mobjects(dt):
+            self.wrap_updaters()
+            update_mobjects(dt)
+
+        def profiled_tear_down():
+            tear_down()
+            self.report()
+
+        scene.update_mobjects = profiled_update_mobjects
+        scene.tear_down = profiled_tear_down
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        return self
+
+    def wrap_updaters(self):
+        """包装场景中所有还没有被包装的 updater"""
+        names = None
+        for mobject in self.scene.mobjects:
+            for member in mobject.get_family():
+                updaters = member.updaters
+                for i, updater in enumerate(updaters):
+                    if isinstance(updater, _TimedUpdater):
+                        continue
+                    if names is None:
+                        names = self._collect_names()
+                    name = self._describe(member, updater, names)
+                    updaters[i] = _TimedUpdater(
+                        updater, self._get_stats(name), self.trace_memory
+                    )
+
+    def _get_stats(self, name):
+        if name not in self.stats:
+            self.stats[name] = UpdaterStats(name)
+        return self.stats[name]
+
+    def _collect_names(self):
+        """从场景属性和 elements 字典中找出 mobject 的名字"""
+        names = {}
+        for key, value in getattr(self.scene, 'elements', {}).items():
+            if isinstance(value, Mobject):
+                names[id(value)] = f"elements['{key}']"
+        for key, value in vars(self.scene).items():
+            if isinstance(value, Mobject):
+                names.setdefault(id(value), key)
+        return names
+
+    @staticmethod
+    def _describe(mobject, updater, names):
+        """给 updater 起一个可读的名字"""
+        func = updater
+        # always_redraw 的 updater 是 lambda，真正的函数在闭包里
+        for cell in getattr(updater, '__closure__', None) or ():
+            content = cell.cell_contents
+            if callable(content) and not isinstance(content, Mobject):
+                func = content
+                break
+        func_name = getattr(func, '__qualname__', None) or repr(func)
+
+        name = names.get(id(mobject))
+        if name is None:
+            return f"{type(mobject).__name__}:{func_name}"
+        if len(mobject.updaters) > 1:
+            return f"{name}:{func_name}"
+        return name
+
+    def get_summary(self):
+        """按总耗时从大到小排序的统计结果"""
+        rows = [stats.summary() for stats in self.stats.values()]
+        return sorted(rows, key=lambda row: row['total'], reverse=True)
+
+    def format_table(self):
+        rows = self.get_summary()
+        width = max([len(row['name']) for row in rows] + [len('updater')])
+        lines = [
+            f"{'updater':<{width}} {'calls':>7} {'total ms':>10} {'mean ms':>9} "
+            f"{'p95 ms':>8} {'alloc KB':>9}"
+        ]
+        for row in rows:
+            lines.append(
+                f"{row['name']:<{width}} {row['calls']:7d} {row['total'] * 1e3:10.2f} "
+                f"{row['mean'] * 1e3:9.3f} {row['p95'] * 1e3:8.3f} "
+                f"{row['allocated_bytes'] / 1024:9.1f}"
+            )
+        return '\n'.join(lines)
+
+    def report(self):
+        """输出表格并写入 JSON，返回 JSON 路径"""
+        if not self.stats:
+            return None
+        logger.info("Updater profile for %s:\n%s", type(self.scene).__name__, self.format_table())
+
+        output_dir = self.output_dir or os.path.join(config.media_dir, 'updater_profiles')
+        os.makedirs(output_dir, exist_ok=True)
+        path = os.path.join(output_dir, f"{type(self.scene).__name__}.json")
+        with open(path, 'w') as f:
+            json.dump({
+                'scene': type(self.scene).__name__,
+                'trace_memory': self.trace_memory,
+                'updaters': self.get_summary(),
+            }, f, indent=2)
+        logger.info("Updater profile written to %s", path)
+        return path
+
+
+def install_updater_profiler(scene, enabled=None, trace_memory=None):
+    """
+    按需给场景安装 updater 统计
+
+    参数:
+    - scene: 场景对象
+    - enabled: 是否启用（默认看环境变量 MANIM_PROFILE_UPDATERS）
+    - trace_memory: 是否统计内存分配（默认环境变量值为 "memory" 时启用）
+
+    返回: UpdaterProfiler，未启用时返回 None
+    """
+    value = os.environ.get(PROFILE_ENV, '')
+    if enabled is None:
+        enabled = bool(value)
+    if not enabled:
+        return None
+    if trace_memory is None:
+        trace_memory = value.lower() == 'memory'
+    return UpdaterProfiler(scene, trace_memory=trace_memory).install()
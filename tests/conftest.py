@@ -0,0 +1,52 @@
+# conftest.py
+# 测试从仓库根目录导入场景和 src 模块（与 python -m src.xxx 相同）
+import os
+import sys
+
+import numpy as np
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture
+def render_frames(tmp_path):
+    """
+    渲染一个小场景，返回写出的每一帧（不编码视频）
+
+    用法: render_frames(SceneClass, install=None)
+    - install: 可选，在 Scene.__init__ 之后、render 之前调用 install(scene)，用来安装钩子
+
+    返回: (帧列表, 场景对象)
+    """
+    manim = pytest.importorskip('manim')
+
+    def render(scene_cls, install=None):
+        frames = []
+        options = {
+            'media_dir': str(tmp_path),
+            'pixel_width': 320,
+            'pixel_height': 180,
+            'frame_rate': 15,
+            'write_to_movie': False,
+            'save_last_frame': False,
+            'disable_caching': True,
+            'progress_bar': 'none',
+            'verbosity': 'WARNING',
+        }
+        with manim.tempconfig(options):
+            scene = scene_cls()
+            if install is not None:
+                install(scene)
+
+            # 在所有钩子之下记录写出的帧（复制，渲染器会复用像素数组）
+            def write_frame(frame, num_frames=1):
+                frames.extend([np.array(frame)] * num_frames)
+
+            scene.renderer.file_writer.write_frame = write_frame
+            scene.render()
+        return frames, scene
+
+    return render
@@ -0,0 +1,78 @@
+# test_path_sampler.py
+# 采样结果与解析解比较
+import numpy as np
+import pytest
+
+manim = pytest.importorskip('manim')
+from manim import *
+
+from src.path_sampler import ArcLengthSampler, CircleSampler, path_sampler
+
+PROPORTIONS = np.linspace(0, 1, 41)
+
+
+def test_circle_uses_closed_form():
+    circle = Circle(radius=2).shift([1, -0.5, 0])
+    sampler = path_sampler(circle)
+    assert isinstance(sampler, CircleSampler)
+
+    angles = TAU * PROPORTIONS
+    expected = np.stack([1 + 2 * np.cos(angles), -0.5 + 2 * np.sin(angles), 0 * angles], axis=1)
+    np.testing.assert_allclose(sampler.points_at(PROPORTIONS), expected, atol=1e-9)
+
+
+def test_flipped_circle_runs_clockwise():
+    sampler = path_sampler(Circle(radius=1).flip(RIGHT))
+    angles = -TAU * PROPORTIONS
+    expected = np.stack([np.cos(angles), np.sin(angles), 0 * angles], axis=1)
+    np.testing.assert_allclose(sampler.points_at(PROPORTIONS), expected, atol=1e-9)
+
+
+def test_point_at_matches_points_at():
+    sampler = path_sampler(Arc(radius=1.5, angle=PI))
+    for proportion in PROPORTIONS[::5]:
+        np.testing.assert_allclose(sampler.point_at(proportion), sampler.points_at([proportion])[0])
+
+
+def test_line_is_linear():
+    start, end = np.array([-2.0, 1.0, 0]), np.array([3.0, -1.0, 0])
+    sampler = ArcLengthSampler(Line(start, end))
+    expected = start + PROPORTIONS[:, np.newaxis] * (end - start)
+    np.testing.assert_allclose(sampler.points_at(PROPORTIONS), expected, atol=1e-9)
+    assert sampler.length == pytest.approx(np.linalg.norm(end - start))
+
+
+def test_arc_is_sampled_by_arc_length():
+    # 半圆弧：比例 p 对应角度 pi * p（贝塞尔近似的误差约 1e-4）
+    sampler = path_sampler(Arc(radius=1, start_angle=0, angle=PI))
+    assert isinstance(sampler, ArcLengthSampler)
+    assert sampler.length == pytest.approx(PI, abs=1e-3)
+
+    angles = PI * PROPORTIONS
+    expected = np.stack([np.cos(angles), np.sin(angles), 0 * angles], axis=1)
+    np.testing.assert_allclose(sampler.points_at(PROPORTIONS), expected, atol=1e-3)
+
+
+def test_parabola_has_uniform_speed():
+    # y = x^2 在 [0, 1] 上的弧长 s(x) = (x sqrt(1 + 4x^2) + asinh(2x) / 2) / 2
+    def arc_length(x):
+        return (x * np.sqrt(1 + 4 * x ** 2) + np.arcsinh(2 * x) / 2) / 2
+
+    curve = ParametricFunction(lambda t: np.array([t, t ** 2, 0]), t_range=[0, 1])
+    sampler = path_sampler(curve, samples_per_curve=64)
+    assert sampler.length == pytest.approx(arc_length(1), abs=1e-4)
+
+    # 每个比例对应的 x：二分求解 s(x) = p * s(1)
+    low, high = np.zeros_like(PROPORTIONS), np.ones_like(PROPORTIONS)
+    for _ in range(60):
+        middle = (low + high) / 2
+        below = arc_length(middle) < PROPORTIONS * arc_length(1)
+        low, high = np.where(below, middle, low), np.where(below, high, middle)
+    x = (low + high) / 2
+    expected = np.stack([x, x ** 2, 0 * x], axis=1)
+    np.testing.assert_allclose(sampler.points_at(PROPORTIONS), expected, atol=1e-3)
+
+
+def test_proportions_are_clamped():
+    sampler = ArcLengthSampler(Line(LEFT, RIGHT))
+    np.testing.assert_allclose(sampler.points_at([-0.5, 1.5]), [LEFT, RIGHT])
@@ -0,0 +1,90 @@
+# test_render_hooks.py
+# 每个渲染钩子打开和关闭时，写出的帧必须逐像素相同
+import numpy as np
+import pytest
+
+manim = pytest.importorskip('manim')
+from manim import *
+
+from src.frame_cache import enable_frame_cache
+from src.frame_dedupe import enable_frame_dedupe
+from src.layer_cache import enable_layer_cache
+from src.updater_profiler import install_updater_profiler
+
+
+class LayeredScene(Scene):
+    """运动的圆前面有同一组里的半透明方块，后面还有一个静止的矩形"""
+
+    def construct(self):
+        square = Square(side_length=2, fill_color=BLUE, fill_opacity=0.5, stroke_width=0)
+        circle = Circle(radius=0.6, color=YELLOW)
+        group = VGroup(square, circle).shift(LEFT * 2)
+        cover = Rectangle(width=2, height=1, fill_color=GREEN, fill_opacity=0.5,
+                          stroke_width=0).shift(RIGHT * 2)
+        self.add(group, cover)
+        self.play(circle.animate.shift(RIGHT * 4), run_time=1)
+        self.play(circle.animate.shift(DOWN), run_time=0.5)
+
+
+class RedrawScene(Scene):
+    """always_redraw 的线段跟着点走，然后停顿"""
+
+    def construct(self):
+        dot = Dot(LEFT * 2)
+        line = always_redraw(lambda: Line(ORIGIN, dot.get_center(), color=RED))
+        self.add(dot, line)
+        self.play(dot.animate.shift(RIGHT * 3), run_time=1)
+        self.wait(1)
+
+
+class TrackerScene(Scene):
+    """跟踪器线性地来回走一遍，每一帧的取值都回到去程到过的值"""
+
+    def construct(self):
+        tracker = ValueTracker(0)
+        dot = always_redraw(lambda: Dot([tracker.get_value() * 4 - 2, 0, 0], color=GREEN))
+        self.add(dot)
+        self.play(tracker.animate.set_value(1), run_time=1, rate_func=linear)
+        self.play(tracker.animate.set_value(0), run_time=1, rate_func=linear)
+        self.wait(0.5)
+
+
+def assert_same_frames(frames, expected):
+    assert len(frames) == len(expected)
+    for index, (frame, reference) in enumerate(zip(frames, expected)):
+        assert np.array_equal(frame, reference), f'frame {index} differs'
+
+
+def test_layer_cache_matches_plain_render(render_frames):
+    expected, _ = render_frames(LayeredScene)
+    caches = []
+    frames, _ = render_frames(LayeredScene, lambda scene: caches.append(enable_layer_cache(scene)))
+    assert_same_frames(frames, expected)
+    assert caches[0].layers_drawn > 0
+
+
+def test_frame_dedupe_matches_plain_render(render_frames):
+    expected, _ = render_frames(RedrawScene)
+    dedupes = []
+    frames, _ = render_frames(RedrawScene, lambda scene: dedupes.append(enable_frame_dedupe(scene)))
+    assert_same_frames(frames, expected)
+    assert dedupes[0].reused > 0
+
+
+def test_frame_cache_matches_plain_render(render_frames):
+    expected, _ = render_frames(TrackerScene)
+    caches = []
+    frames, _ = render_frames(TrackerScene, lambda scene: caches.append(enable_frame_cache(scene)))
+    assert_same_frames(frames, expected)
+    assert caches[0].hits > 0
+
+
+def test_updater_profiler_matches_plain_render(render_frames, tmp_path):
+    expected, _ = render_frames(RedrawScene)
+    profilers = []
+    frames, _ = render_frames(
+        RedrawScene, lambda scene: profilers.append(install_updater_profiler(scene, enabled=True))
+    )
+    assert_same_frames(frames, expected)
+    assert profilers[0].get_summary()[0]['calls'] > 0
+    assert (tmp_path / 'updater_profiles' / 'RedrawScene.json').exists()
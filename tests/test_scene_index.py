@@ -0,0 +1,128 @@
+# test_scene_index.py
+# SceneIndex 只做静态分析，不需要 manim
+import os
+import textwrap
+
+import pytest
+
+from src import scene_index
+from src.scene_index import SceneIndex
+
+FILES = {
+    'base.py': '''
+        from manim import *
+
+        class Base(Scene):
+            pass
+
+        class Helper:
+            pass
+    ''',
+    'child.py': '''
+        import base
+
+        class Child(base.Base):
+            pass
+    ''',
+    'other.py': '''
+        from src.helpers import Cam
+
+        class Deep(Cam):
+            pass
+
+        class Orphan(Unknown):
+            pass
+    ''',
+    'broken.py': '''
+        class Broken(Scene)
+            pass
+    ''',
+    os.path.join('src', 'helpers.py'): '''
+        from manim import MovingCameraScene as MCS
+
+        class Cam(MCS):
+            pass
+    ''',
+}
+
+
+def write_tree(root, files):
+    for relative, source in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(source))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    write_tree(tmp_path, FILES)
+    return tmp_path
+
+
+def load(root):
+    return SceneIndex(root=str(root)).load()
+
+
+def test_finds_scenes_through_imports(tree):
+    index = load(tree)
+    ids = {scene['id'] for scene in index.scenes()}
+    assert ids == {'base:Base', 'child:Child', 'other:Deep', 'src.helpers:Cam'}
+    assert ('other', 'Orphan', 'Unknown') in index.unresolved
+
+
+def test_scene_records(tree):
+    scenes = {scene['id']: scene for scene in load(tree).scenes()}
+    assert scenes['child:Child'] == {
+        'id': 'child:Child',
+        'module': 'child',
+        'name': 'Child',
+        'file': 'child.py',
+        'line': 4,
+    }
+    assert scenes['src.helpers:Cam']['file'] == os.path.join('src', 'helpers.py')
+
+
+def test_dependencies(tree):
+    index = load(tree)
+    assert index.get_dependencies('other') == ['other', 'src.helpers']
+    assert index.get_dependencies('child') == ['base', 'child']
+
+
+def test_select(tree):
+    index = load(tree)
+    assert [scene['id'] for scene in index.select(['Child'])] == ['child:Child']
+    assert {scene['id'] for scene in index.select(['src.*', 'base:*'])} == {
+        'src.helpers:Cam', 'base:Base'
+    }
+    assert len(index.select()) == 4
+
+
+def test_unchanged_files_come_from_cache(tree, monkeypatch):
+    load(tree)
+    assert (tree / scene_index.CACHE_FILE).exists()
+
+    parse_module = scene_index.parse_module
+    parsed = []
+
+    def counting_parse_module(path, module_name):
+        parsed.append(os.path.basename(path))
+        return parse_module(path, module_name)
+
+    monkeypatch.setattr(scene_index, 'parse_module', counting_parse_module)
+    index = load(tree)
+    # 有语法错误的文件不进缓存，每次都重新解析；其余文件都来自缓存
+    assert parsed == ['broken.py']
+    assert 'child:Child' in {scene['id'] for scene in index.scenes()}
+
+
+def test_changed_file_is_parsed_again(tree):
+    load(tree)
+    path = tree / 'child.py'
+    # 两次修改都改变了文件大小，签名 (mtime, 大小) 一定不同
+    path.write_text(path.read_text() + '\nclass Second(Base):\n    pass\n')
+    ids = {scene['id'] for scene in load(tree).scenes()}
+    # Base 没有在 child 中导入，Second 不是场景
+    assert 'child:Second' not in ids
+    path.write_text(path.read_text().replace('(Base)', '(base.Base)'))
+    assert 'child:Second' in {scene['id'] for scene in load(tree).scenes()}
+
@@ -0,0 +1,117 @@
+# test_streaming_path.py
+import numpy as np
+import pytest
+
+manim = pytest.importorskip('manim')
+from manim import *
+
+from src.streaming_path import StreamingPath, _rdp_mask
+
+
+def distance_to_polyline(points, polyline):
+    """每个点到折线的最短距离"""
+    starts, ends = polyline[:-1], polyline[1:]
+    segments = ends - starts
+    lengths_sq = np.maximum((segments ** 2).sum(axis=1), 1e-300)
+    offsets = points[:, np.newaxis] - starts[np.newaxis]
+    t = np.clip((offsets * segments).sum(axis=2) / lengths_sq, 0, 1)
+    nearest = starts + t[:, :, np.newaxis] * segments
+    return np.linalg.norm(points[:, np.newaxis] - nearest, axis=2).min(axis=1)
+
+
+def subpath_starts(path):
+    """每段子路径第一条曲线的序号（曲线起点与上一条曲线终点不同的位置）"""
+    curves = path.points.reshape(-1, 4, 3)
+    jumps = np.any(curves[1:, 0] != curves[:-1, 3], axis=1)
+    return np.concatenate([[0], np.flatnonzero(jumps) + 1])
+
+
+def test_rdp_drops_collinear_points():
+    points = np.stack([np.linspace(0, 1, 11), np.linspace(0, 2, 11), np.zeros(11)], axis=1)
+    assert np.flatnonzero(_rdp_mask(points, 1e-9)).tolist() == [0, 10]
+
+
+def test_rdp_keeps_corners():
+    points = np.array([[0, 0, 0], [1, 0, 0], [2, 0, 0], [2, 1, 0], [2, 2, 0]], dtype=float)
+    assert np.flatnonzero(_rdp_mask(points, 1e-3)).tolist() == [0, 2, 4]
+
+
+def test_rdp_error_is_bounded():
+    t = np.linspace(0, 4 * PI, 500)
+    points = np.stack([t, np.sin(t), np.zeros_like(t)], axis=1)
+    tolerance = 0.01
+    keep = _rdp_mask(points, tolerance)
+    assert keep[0] and keep[-1]
+    assert keep.sum() < len(points) // 4
+    assert distance_to_polyline(points, points[keep]).max() <= tolerance + 1e-12
+
+
+def test_rdp_handles_retrace():
+    # 折返的轨迹：按到线段（不是直线）的距离判断，折返点必须保留
+    points = np.array([[0, 0, 0], [2, 0, 0], [1, 0, 0]], dtype=float)
+    assert _rdp_mask(points, 1e-3).all()
+
+
+def test_samples_and_segments():
+    path = StreamingPath(ORIGIN, capacity=2)
+    for point in ([1, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]):
+        path.add_sample(point)
+    # 重复的点不追加；容量按需增长
+    np.testing.assert_allclose(path.get_samples(), [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    curves = path.points.reshape(-1, 4, 3)
+    assert len(curves) == 3
+    np.testing.assert_allclose(curves[1], [[1, 0, 0], [1, 1 / 3, 0], [1, 2 / 3, 0], [1, 1, 0]])
+
+    path.clear_samples()
+    assert path.get_num_samples() == 0 and len(path.points) == 0
+
+
+@pytest.mark.parametrize('max_points, trace', [
+    # 从左向右扫过画面并移出右边缘的正弦曲线
+    (64, lambda t: [t * 0.5 - 5, np.sin(t), 0]),
+    # 一直在画面内反复描绘的利萨如曲线
+    (256, lambda t: [3 * np.sin(1.3 * t), 2 * np.sin(2.1 * t), 0]),
+])
+def test_sample_count_never_exceeds_max_points(max_points, trace):
+    path = StreamingPath(max_points=max_points)
+    for frame in range(5000):
+        path.add_sample(trace(frame / 60))
+        assert path.get_num_samples() <= max_points
+    assert path.max_points == max_points
+    assert len(path.points) == 4 * (path.get_num_samples() - 1)
+
+
+def test_simplification_stays_within_tolerance():
+    # 画面内的点足够少，不需要抽稀：化简后的轨迹与原始采样的偏差不超过 tolerance
+    tolerance = 0.01
+    path = StreamingPath(max_points=512, tolerance=tolerance)
+    t = np.linspace(0, 2 * PI, 2000)
+    samples = np.stack([t - PI, np.sin(3 * t), np.zeros_like(t)], axis=1)
+    for sample in samples:
+        path.add_sample(sample)
+    assert path.get_num_samples() < 512
+    assert distance_to_polyline(samples, path.get_samples()).max() <= tolerance + 1e-12
+
+
+def test_off_screen_excursion_is_dropped_and_path_split():
+    # 向右移出画面，绕一圈后从下方回到画面内：画面外的部分丢掉，回来的部分保留
+    path = StreamingPath(max_points=64, tolerance=1e-6)
+    outward = [[x, 0, 0] for x in np.linspace(0, 12, 200)]
+    around = [[12, y, 0] for y in np.linspace(0, -8, 100)]
+    back = [[x, -8 + (12 - x) * 0.5, 0] for x in np.linspace(12, 0, 400)]
+    for point in outward + around + back:
+        path.add_sample(point)
+
+    assert path.get_num_samples() <= 64
+    # 画面外的绕行被丢掉，没有连接两端的直线
+    assert len(subpath_starts(path)) >= 2
+    x_radius = config.frame_width / 2 + 0.1
+    y_radius = config.frame_height / 2 + 0.1
+    for curve in path.points.reshape(-1, 4, 3):
+        if np.all(curve == curve[0]):
+            continue  # 断开处的退化曲线
+        lower, upper = curve.min(axis=0), curve.max(axis=0)
+        assert lower[0] <= x_radius and upper[0] >= -x_radius
+        assert lower[1] <= y_radius and upper[1] >= -y_radius
+    # 最后一个点总是保留
+    np.testing.assert_allclose(path.get_samples()[-1], back[-1])
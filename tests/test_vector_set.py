@@ -0,0 +1,88 @@
+# test_vector_set.py
+import numpy as np
+import pytest
+
+manim = pytest.importorskip('manim')
+from manim import *
+
+from src.originsingle_vector import VectorSet
+
+ORIGINS = np.array([[0, 0, 0], [1, 1, 0], [-2, 0, 0]], dtype=float)
+VECTORS = np.array([[3, 0, 0], [0, 0.8, 0], [1, 1, 0]], dtype=float)
+
+
+def make_vector_set(**kwargs):
+    return VectorSet(ORIGINS, VECTORS, **kwargs)
+
+
+def expected_tip_lengths(vectors, max_tip_length=0.35, tip_ratio=0.25):
+    return np.minimum(max_tip_length, tip_ratio * np.linalg.norm(vectors, axis=1))
+
+
+def test_shafts_and_tips():
+    vector_set = make_vector_set()
+    np.testing.assert_allclose(vector_set.origins, ORIGINS)
+    np.testing.assert_allclose(vector_set.vectors, VECTORS)
+    np.testing.assert_allclose(vector_set.get_ends(), ORIGINS + VECTORS)
+
+    lengths = np.linalg.norm(VECTORS, axis=1)
+    units = VECTORS / lengths[:, np.newaxis]
+    tip_lengths = expected_tip_lengths(VECTORS)
+    bases = ORIGINS + VECTORS - units * tip_lengths[:, np.newaxis]
+
+    # 一种颜色：一个箭杆 VMobject（每个向量一段直线）和一个箭头尖 VMobject（每个向量三段）
+    shafts = vector_set.shafts[0].points.reshape(-1, 4, 3)
+    np.testing.assert_allclose(shafts[:, 0], ORIGINS)
+    np.testing.assert_allclose(shafts[:, 3], bases)
+    np.testing.assert_allclose(shafts[:, 1], ORIGINS + (bases - ORIGINS) / 3)
+
+    tips = vector_set.tips[0].points.reshape(-1, 3, 4, 3)
+    apex, left, right = tips[:, 0, 0], tips[:, 1, 0], tips[:, 2, 0]
+    np.testing.assert_allclose(apex, ORIGINS + VECTORS)
+    np.testing.assert_allclose(tips[:, 2, 3], apex)
+    # 等边三角形：底边中点在箭杆末端，半宽 tip_length / sqrt(3)，底边垂直于向量
+    np.testing.assert_allclose((left + right) / 2, bases)
+    np.testing.assert_allclose(np.linalg.norm(left - right, axis=1) / 2, tip_lengths / np.sqrt(3))
+    np.testing.assert_allclose(((left - right) * units).sum(axis=1), 0, atol=1e-12)
+
+
+def test_colors_are_grouped():
+    vector_set = make_vector_set(colors=[RED, BLUE, RED])
+    assert len(vector_set.shafts) == 2 and len(vector_set.tips) == 2
+    assert len(vector_set.shafts[0].points) == 8 and len(vector_set.tips[0].points) == 24
+    np.testing.assert_allclose(vector_set.vectors, VECTORS)
+
+
+def test_zero_vector_is_degenerate():
+    vector_set = VectorSet([[1, 2, 0]], [[0, 0, 0]])
+    assert np.isfinite(vector_set.shafts[0].points).all()
+    assert np.isfinite(vector_set.tips[0].points).all()
+    np.testing.assert_allclose(vector_set.tips[0].points, [[1, 2, 0]] * 12)
+
+
+def test_geometry_follows_transforms():
+    vector_set = make_vector_set()
+    vector_set.shift([1, -2, 0])
+    np.testing.assert_allclose(vector_set.origins, ORIGINS + [1, -2, 0])
+    np.testing.assert_allclose(vector_set.vectors, VECTORS)
+
+    vector_set.rotate(PI / 2, about_point=ORIGIN)
+    rotation = np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]])
+    np.testing.assert_allclose(vector_set.origins, (ORIGINS + [1, -2, 0]) @ rotation.T, atol=1e-12)
+    np.testing.assert_allclose(vector_set.vectors, VECTORS @ rotation.T, atol=1e-12)
+
+
+def test_scale_vectors_keeps_origins():
+    vector_set = make_vector_set()
+    vector_set.scale_vectors([2, 0.5, 1])
+    np.testing.assert_allclose(vector_set.origins, ORIGINS)
+    np.testing.assert_allclose(vector_set.vectors, VECTORS * [[2], [0.5], [1]])
+    tips = vector_set.tips[0].points.reshape(-1, 3, 4, 3)
+    np.testing.assert_allclose(tips[:, 0, 0], vector_set.get_ends())
+
+
+def test_set_vectors():
+    vector_set = make_vector_set()
+    vector_set.set_vectors(vectors=-VECTORS, origins=ORIGINS + UP)
+    np.testing.assert_allclose(vector_set.origins, ORIGINS + UP)
+    np.testing.assert_allclose(vector_set.vectors, -VECTORS)
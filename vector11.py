@@ -1,18 +1,26 @@
 from manim import *
 from src.originsingle_vector import SingleVector as sv
+from src.play_merge import merged_plays
+from src.tex_warmup import precompile_tex
+
+# 五个向量的参数（construct 创建向量、setup 预编译标签都读这里）
+VECTORS = [
+    dict(vector=[3, 0, 0], color=YELLOW, origin=[-2, -2, 0], start_label='O', mid_label=r"\vec{v}", end_label='A'),
+    dict(vector=[0, 2, 0], color=GREEN, origin=[-2, -2, 0], mid_label=r"\vec{u}", end_label='B'),
+    dict(vector=[3, 2, 0], color=RED, origin=[-2, -2, 0], mid_label=r"\vec{v}+\vec{u}", end_label='C'),
+    dict(vector=[3, 0, 0], color=YELLOW, origin=[-2, 0, 0], mid_label=r"\vec{v}"),
+    dict(vector=[0, 2, 0], color=GREEN, origin=[1, -2, 0], mid_label=r"\vec{u}"),
+]
 
 class vecetor_example(Scene):
+
+    def setup(self):
+        # construct 之前一次性并行编译五个向量的所有标签
+        precompile_tex([label for spec in VECTORS for label in sv.get_tex_items(**spec)])
+
     def construct(self):
-        vector1 = sv(vector=[3, 0, 0], color=YELLOW,origin=[-2,-2,0],start_label='O',label=r"\vec{v}",end_label='A')
-        vector1.show(self, create_time=2, write_time=1)
-       
-        vector2 = sv(vector=[0, 2, 0], color=GREEN,origin=[-2,-2,0],label=r"\vec{u}",end_label='B')
-        vector2.show(self, create_time=2, write_time=1) 
-        
-        vector3 = sv(vector=[3, 2, 0], color=RED,origin=[-2,-2,0],label=r"\vec{v}+\vec{u}",end_label='C')     
-        vector3.show(self, create_time=2, write_time=1) 
-        vector4 = sv(vector=[3, 0, 0], color=YELLOW,origin=[-2,0,0],label=r"\vec{v}")
-        
-        vector4.show(self, create_time=2, write_time=1)
-        vector5 = sv(vector=[0, 2, 0], color=GREEN,origin=[1,-2,0],label=r"\vec{u}")
-        vector5.show(self, create_time=2, write_time=1) 
\ No newline at end of file
+        # 五个向量的所有动画合成一个片段
+        with merged_plays(self):
+            for spec in VECTORS:
+                vector = sv(**spec)
+                vector.show(self, create_time=2, write_time=1)
@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from src.tex_cache import cached_math_tex
 
 class BasicVectors(Scene):
     def construct(self):
@@ -59,7 +60,7 @@ class BasicVectors(Scene):
         
         # 4. P点标签
         point_label = always_redraw(
-            lambda: MathTex("P").scale(0.8).next_to(
+            lambda: cached_math_tex("P", scale=0.8).next_to(
                 get_point_position(), UP, buff=0.1
             )
         )
@@ -77,9 +78,9 @@ class BasicVectors(Scene):
         
         # 6. 线段标签（可选）
         line_label = always_redraw(
-            lambda: MathTex(r"\overrightarrow{OP}").scale(0.7).next_to(
+            lambda: cached_math_tex(r"\overrightarrow{OP}", scale=0.7, color=PURPLE).next_to(
                 (origin + get_point_position()) / 2, LEFT, buff=0.1
-            ).set_color(PURPLE)
+            )
         )
         
         # ====================== 动画序列 ======================
@@ -0,0 +1,28 @@
+from manim import *
+from src.originsingle_vector import VectorSet
+
+class VectorFieldExample(Scene):
+    def construct(self):
+        # 网格上的旋转场，所有箭头由一个 VectorSet 生成
+        xs, ys = np.meshgrid(np.arange(-6, 6.5, 0.5), np.arange(-3.5, 4, 0.5))
+        origins = np.stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)], axis=1)
+        vectors = 0.15 * np.stack([-origins[:, 1], origins[:, 0], np.zeros(xs.size)], axis=1)
+        lengths = np.linalg.norm(vectors, axis=1)
+        colors = [BLUE if length < 0.5 else GREEN if length < 0.8 else RED for length in lengths]
+
+        field = VectorSet(origins, vectors, colors=colors, stroke_width=2)
+        self.play(FadeIn(field), run_time=1)
+        self.wait(0.5)
+
+        field.scale_vectors(0.6)
+        self.wait(0.5)
+        field.set_vector_colors(YELLOW)
+        self.wait(0.5)
+
+        basis = VectorSet([0, 0, 0], [[2, 0, 0], [0, 2, 0]], colors=[RED, GREEN],
+                          labels=[r"\vec{i}", r"\vec{j}"])
+        self.play(Create(basis), run_time=1)
+        self.play(basis.animate.shift(LEFT * 2), run_time=1)
+        # origins / vectors 由点数据得到，动画之后在新位置上继续缩放
+        basis.scale_vectors(1.5)
+        self.wait(1)
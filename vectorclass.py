@@ -1,5 +1,24 @@
 from manim import *
 import numpy as np
+from src.tex_cache import cached_math_tex
+from src.tex_warmup import precompile_tex
+from src.updater_profiler import install_updater_profiler
+from src.frame_cache import enable_frame_cache
+from src.layer_cache import enable_layer_cache
+from src.frame_dedupe import enable_frame_dedupe
+from src.step_cache import StepCache
+from src.trajectory import TrackerTimeline, box_in_frame
+
+# 解释公式
+EXPLANATION_TEX = (
+    r"P(t) &= \vec{b} + t(2\vec{a} - \vec{b}) \\",
+    r"&= (1-t)\vec{b} + 2t\vec{a} \\",
+    r"t &\in [0, 1]"
+)
+
+# 这些设置步骤之后停顿 0.5 秒
+PAUSED_STEPS = ('segment', 'connection', 'point')
+
 
 class VectorDiagramConfig:
     """向量图配置类"""
@@ -40,23 +59,92 @@ class VectorDiagramConfig:
         
         self.show_explanation = show_explanation
 
+    def get_tex_items(self):
+        """图中会用到的所有 TeX 字符串（从配置中静态收集，不创建对象）"""
+        items = [self.labels['a'], self.labels['b'], self.labels['2a']]
+        items.append({'tex_strings': self.labels['point'], 'scale': 0.8})
+        items.append({
+            'tex_strings': self.labels['line'],
+            'scale': 0.7,
+            'color': self.colors['line_to_origin']
+        })
+        if self.show_explanation:
+            items.append(EXPLANATION_TEX)
+        return items
+
+    def get_cache_inputs(self):
+        """决定画面内容的全部配置（纯数据，用于计算缓存键）"""
+        return {
+            'vec_a': np.asarray(self.vec_a, dtype=float).tolist(),
+            'vec_b': np.asarray(self.vec_b, dtype=float).tolist(),
+            'shift_amount': np.asarray(self.shift_amount, dtype=float).tolist(),
+            'colors': {key: ManimColor(color).to_hex(with_alpha=True) for key, color in self.colors.items()},
+            'labels': self.labels,
+            'show_explanation': self.show_explanation,
+        }
+
 
 class FlexibleVectorDiagram(Scene):
     """灵活的向量图类"""
     
+    # 渲染优化默认都关闭，在子类中打开
+    # 帧缓存上限（字节），0 表示不缓存；点回到到过的位置时直接复用帧
+    frame_cache_bytes = 0
+    # 静止的向量、线段和标签每次 play 只光栅化一次
+    use_layer_cache = False
+    # wait 时 always_redraw 重建出的画面不变，直接复用上一帧
+    use_frame_dedupe = False
+    # 统计每个 always_redraw 的耗时（None 时看环境变量 MANIM_PROFILE_UPDATERS）
+    profile_updaters = None
+    
+    # 动画序列（construct 和数值模式 evaluate_trajectory 共用）
+    initial_alpha = 0.1
+    setup_sequence = [
+        ('vectors', 2, 0.3),
+        ('labels', 1.5, 0.3),
+        ('segment', 1, None),
+        ('connection', 1, None),
+        ('point', 1, None)
+    ]
+    move_targets = [1, 0.5, 0.25, 0.75, 0.33, 0.67]
+    move_durations = [3, 2, 1.5, 1.5, 1.5, 1.5]
+    move_rate_funcs = [linear, smooth, smooth, smooth, smooth, smooth]
+    final_wait = 2
+    
+    # 标签的大致尺寸（宽, 高），数值模式中用来判断标签是否离开画面
+    label_sizes = {'point': (0.3, 0.4), 'line': (0.7, 0.5)}
+    
     def __init__(self, config=None, **kwargs):
         super().__init__(**kwargs)
-        self.config = config if config else VectorDiagramConfig()
-        self.alpha_tracker = ValueTracker(0.1)
+        self.config = config if config else self.make_config()
+        self.alpha_tracker = ValueTracker(self.initial_alpha)
         self.elements = {}
+        install_updater_profiler(self, enabled=self.profile_updaters)
+        if self.use_layer_cache:
+            enable_layer_cache(self)
+        if self.use_frame_dedupe:
+            enable_frame_dedupe(self)
+        if self.frame_cache_bytes:
+            enable_frame_cache(self, self.frame_cache_bytes)
+    
+    @classmethod
+    def make_config(cls):
+        """默认配置（子类覆盖这个方法来修改颜色、标签和向量）"""
+        return VectorDiagramConfig()
     
     def setup(self):
         """初始化所有元素"""
+        # 先并行编译所有标签，后面创建 MathTex 时直接使用缓存
+        precompile_tex(self.get_tex_items())
         self._setup_vectors()
         self._setup_lines()
         self._setup_labels()
         self._setup_animation_elements()
     
+    def get_tex_items(self):
+        """场景会用到的所有 TeX 字符串"""
+        return self.config.get_tex_items()
+    
     def _setup_vectors(self):
         """设置向量"""
         self.elements['vec_a'] = Vector(
@@ -123,7 +211,7 @@ class FlexibleVectorDiagram(Scene):
         
         # 点标签
         self.elements['point_label'] = always_redraw(
-            lambda: MathTex(self.config.labels['point']).scale(0.8).next_to(
+            lambda: cached_math_tex(self.config.labels['point'], scale=0.8).next_to(
                 get_point_position(), UP, buff=0.1
             )
         )
@@ -141,69 +229,76 @@ class FlexibleVectorDiagram(Scene):
         
         # 连接线标签
         self.elements['line_label'] = always_redraw(
-            lambda: MathTex(self.config.labels['line']).scale(0.7).next_to(
+            lambda: cached_math_tex(
+                self.config.labels['line'],
+                scale=0.7,
+                color=self.config.colors['line_to_origin']
+            ).next_to(
                 (self.origin + get_point_position()) / 2, LEFT, buff=0.1
-            ).set_color(self.config.colors['line_to_origin'])
+            )
         )
     
     def animate_setup(self, sequence=None):
         """执行设置动画序列"""
         if sequence is None:
-            sequence = [
-                ('vectors', 2, 0.3),
-                ('labels', 1.5, 0.3),
-                ('segment', 1, None),
-                ('connection', 1, None),
-                ('point', 1, None)
-            ]
+            sequence = self.setup_sequence
+        
+        # 每一步按配置、步骤内容和之前的状态缓存片段，没有改动的步骤直接复用
+        step_cache = StepCache(self, {
+            'config': self.config.get_cache_inputs(),
+            'initial_alpha': self.initial_alpha,
+        })
         
         for step in sequence:
-            element_type, duration, lag_ratio = step
-            
-            if element_type == 'vectors':
-                self.play(
-                    LaggedStart(
-                        Create(self.elements['vec_a']),
-                        Create(self.elements['vec_b']),
-                        Create(self.elements['vec_2a']),
-                        lag_ratio=lag_ratio
-                    ),
-                    run_time=duration
-                )
-            
-            elif element_type == 'labels':
-                self.play(
-                    LaggedStart(
-                        Write(self.elements['label_a']),
-                        Write(self.elements['label_b']),
-                        Write(self.elements['label_2a']),
-                        lag_ratio=lag_ratio
-                    ),
-                    run_time=duration
-                )
-            
-            elif element_type == 'segment':
-                self.play(
-                    Create(self.elements['segment']),
-                    run_time=duration
-                )
-                self.wait(0.5)
-            
-            elif element_type == 'connection':
-                self.play(
-                    Create(self.elements['line_to_origin']),
-                    Write(self.elements['line_label']),
-                    run_time=duration
-                )
-                self.wait(0.5)
-            
-            elif element_type == 'point':
-                self.play(
-                    FadeIn(self.elements['moving_point'], scale=0.5),
-                    Write(self.elements['point_label']),
-                    run_time=duration
-                )
-                self.wait(0.5)
+            with step_cache.step(*step):
+                self._animate_step(*step)
+    
+    def _animate_step(self, element_type, duration, lag_ratio):
+        """执行设置动画中的一步"""
+        if element_type == 'vectors':
+            self.play(
+                LaggedStart(
+                    Create(self.elements['vec_a']),
+                    Create(self.elements['vec_b']),
+                    Create(self.elements['vec_2a']),
+                    lag_ratio=lag_ratio
+                ),
+                run_time=duration
+            )
+        
+        elif element_type == 'labels':
+            self.play(
+                LaggedStart(
+                    Write(self.elements['label_a']),
+                    Write(self.elements['label_b']),
+                    Write(self.elements['label_2a']),
+                    lag_ratio=lag_ratio
+                ),
+                run_time=duration
+            )
+        
+        elif element_type == 'segment':
+            self.play(
+                Create(self.elements['segment']),
+                run_time=duration
+            )
+        
+        elif element_type == 'connection':
+            self.play(
+                Create(self.elements['line_to_origin']),
+                Write(self.elements['line_label']),
+                run_time=duration
+            )
+        
+        elif element_type == 'point':
+            self.play(
+                FadeIn(self.elements['moving_point'], scale=0.5),
+                Write(self.elements['point_label']),
+                run_time=duration
+            )
+        
+        if element_type in PAUSED_STEPS:
+            self.wait(0.5)
     
     def move_point(self, target_values, durations=None, rate_funcs=None):
         """移动点序列"""
@@ -234,23 +329,19 @@ class FlexibleVectorDiagram(Scene):
         
         # 示例动画序列
         self.move_point(
-            target_values=[1, 0.5, 0.25, 0.75, 0.33, 0.67],
-            durations=[3, 2, 1.5, 1.5, 1.5, 1.5],
-            rate_funcs=[linear, smooth, smooth, smooth, smooth, smooth]
+            target_values=self.move_targets,
+            durations=self.move_durations,
+            rate_funcs=self.move_rate_funcs
         )
         
         if self.config.show_explanation:
             self._add_explanation()
         
-        self.wait(2)
+        self.wait(self.final_wait)
     
     def _add_explanation(self):
         """添加解释"""
-        explanation = MathTex(
-            r"P(t) &= \vec{b} + t(2\vec{a} - \vec{b}) \\",
-            r"&= (1-t)\vec{b} + 2t\vec{a} \\",
-            r"t &\in [0, 1]"
-        ).scale(0.6).to_edge(DOWN)
+        explanation = MathTex(*EXPLANATION_TEX).scale(0.6).to_edge(DOWN)
         
         explanation.set_color_by_tex_to_color_map({
             r"\vec{a}": self.config.colors['a'],
@@ -259,14 +350,67 @@ class FlexibleVectorDiagram(Scene):
         })
         
         self.play(Write(explanation), run_time=2)
+    
+    @classmethod
+    def evaluate_trajectory(cls, config=None, frame_rate=None):
+        """
+        数值模式：不创建 mobject、不调用 TeX 和 Cairo，算出每一帧的轨迹
+        
+        参数:
+        - config: VectorDiagramConfig（默认 cls.make_config()）
+        - frame_rate: 帧率（默认 manim 配置中的帧率）
+        
+        返回: 字典，每一项是按帧排列的数组
+        - time, alpha, play: 场景时间、alpha_tracker 的值、第几次 play
+        - point: 动点 P 的位置 (N, 3)
+        - op_length: |OP|
+        - point_label_in_frame, line_label_in_frame: 标签是否完全在画面内
+        """
+        diagram_config = config if config else cls.make_config()
+        
+        timeline = TrackerTimeline(cls.initial_alpha)
+        for element_type, duration, _ in cls.setup_sequence:
+            timeline.wait(duration, element_type)
+            if element_type in PAUSED_STEPS:
+                timeline.wait(0.5)
+        for target, duration, rate_func in zip(cls.move_targets, cls.move_durations, cls.move_rate_funcs):
+            timeline.animate(target, duration, rate_func)
+        if diagram_config.show_explanation:
+            timeline.wait(2, 'explanation')
+        timeline.wait(cls.final_wait)
+        data = timeline.sample(frame_rate)
+        
+        shift = diagram_config.shift_amount
+        origin = ORIGIN + shift
+        start = diagram_config.vec_b + shift
+        end = diagram_config.vec_2a + shift
+        alpha = data['value']
+        point = start + alpha[:, np.newaxis] * (end - start)
+        
+        # 点标签在 P 上方 0.1 处，连接线标签在 OP 中点左侧 0.1 处
+        width, height = cls.label_sizes['point']
+        point_label_corner = point + np.array([-width / 2, 0.1, 0])
+        line_width, line_height = cls.label_sizes['line']
+        line_label_corner = (origin + point) / 2 + np.array([-0.1 - line_width, -line_height / 2, 0])
+        
+        return {
+            'time': data['time'],
+            'alpha': alpha,
+            'play': data['play'],
+            'point': point,
+            'op_length': np.linalg.norm(point - origin, axis=1),
+            'point_label_in_frame': box_in_frame(point_label_corner, (width, height)),
+            'line_label_in_frame': box_in_frame(line_label_corner, (line_width, line_height)),
+            'names': data['names'],
+        }
 
 
 # ====================== 使用示例 ======================
 class CustomVectorDiagram1(FlexibleVectorDiagram):
     """自定义示例1：修改颜色和标签"""
-    def construct(self):
-        # 创建配置
-        config = VectorDiagramConfig(
+    @classmethod
+    def make_config(cls):
+        return VectorDiagramConfig(
             colors={
                 'a': TEAL,
                 'b': PINK,
@@ -283,39 +427,30 @@ class CustomVectorDiagram1(FlexibleVectorDiagram):
                 'line': r"\overrightarrow{OQ}"
             }
         )
-        
-        self.config = config
-        super().construct()
 
 
 class CustomVectorDiagram2(FlexibleVectorDiagram):
     """自定义示例2：修改向量和动画序列"""
-    def construct(self):
-        config = VectorDiagramConfig(
+    # 自定义动画序列
+    setup_sequence = [
+        ('vectors', 2, 0.2),
+        ('segment', 1, None),
+        ('labels', 1, 0.2),
+        ('connection', 1, None),
+        ('point', 1, None)
+    ]
+    
+    # 自定义移动序列
+    move_targets = [0, 0.5, 1, 0.25, 0.75]
+    move_durations = [2, 1.5, 2, 1, 1]
+    move_rate_funcs = [smooth, smooth, linear, smooth, smooth]
+    final_wait = 3
+    
+    @classmethod
+    def make_config(cls):
+        return VectorDiagramConfig(
             vec_a=np.array([2, 1, 0]),
             vec_b=np.array([-1, 3, 0]),
-            shift_amount=UP * 1
-        )
-        
-        self.config = config
-        self.setup()
-        
-        # 自定义动画序列
-        custom_sequence = [
-            ('vectors', 2, 0.2),
-            ('segment', 1, None),
-            ('labels', 1, 0.2),
-            ('connection', 1, None),
-            ('point', 1, None)
-        ]
-        
-        self.animate_setup(sequence=custom_sequence)
-        
-        # 自定义移动序列
-        self.move_point(
-            target_values=[0, 0.5, 1, 0.25, 0.75],
-            durations=[2, 1.5, 2, 1, 1],
-            rate_funcs=[smooth, smooth, linear, smooth, smooth]
+            shift_amount=UP * 1,
+            show_explanation=False
         )
-        
-        self.wait(3)
\ No newline at end of file